@@ -0,0 +1,34 @@
+"""
+Console-script entry point for cicd-framework
+Answers `version` without importing Typer; everything else goes to cli.main
+"""
+import sys
+
+VERSION = "1.0.0"
+AUTHOR = "Ayoub Jedidi"
+
+
+def print_version() -> None:
+    """Print version information, with colors only when stdout is a terminal"""
+    if not sys.stdout.isatty():
+        # Same text rich renders for a non-terminal, without importing rich
+        sys.stdout.write(f"\nCI/CD Framework Generator\nVersion: {VERSION}\nAuthor: {AUTHOR}\n\n")
+        return
+
+    from rich.console import Console
+
+    console = Console()
+    console.print("\n[bold cyan]CI/CD Framework Generator[/bold cyan]")
+    console.print(f"[dim]Version:[/dim] [green]{VERSION}[/green]")
+    console.print(f"[dim]Author:[/dim] [yellow]{AUTHOR}[/yellow]")
+    console.print()
+
+
+def main():
+    """Entry point for the CLI"""
+    if sys.argv[1:] in (['version'], ['--version']):
+        print_version()
+        return
+
+    from cli.main import main as typer_main
+    typer_main()
@@ -1,13 +1,20 @@
 """
 CLI for cicd-framework tool
 Auto-detects project framework and generates CI/CD files
+
+Only typer and rich's Console are imported at module load; tables, JSON
+highlighting, the thread pool and the framework registry are imported by
+the commands that use them so --help and version start fast.
 """
-from typing import Optional, List
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, List, Dict, Tuple
 import typer
 from pathlib import Path
 from rich.console import Console
-from rich.table import Table
-from frameworks import AVAILABLE_FRAMEWORKS
+
+if TYPE_CHECKING:
+    from core.project_snapshot import ProjectSnapshot
 
 app = typer.Typer(
     help="CI/CD Framework Generator - Auto-detect and generate pipeline files",
@@ -15,6 +22,145 @@ app = typer.Typer(
 )
 console = Console()
 
+# Accepted option values: ordered tuples for messages, frozensets for membership
+_PLATFORMS_ORDERED = ('jenkins', 'gitlab', 'github')
+_VALID_PLATFORMS = frozenset(_PLATFORMS_ORDERED)
+_DEPLOYMENT_TYPES_ORDERED = ('webapp', 'instance')
+_VALID_DEPLOYMENT_TYPES = frozenset(_DEPLOYMENT_TYPES_ORDERED)
+_CLOUD_PROVIDERS_ORDERED = ('local', 'aws', 'azure', 'gcp')
+_VALID_CLOUD_PROVIDERS = frozenset(_CLOUD_PROVIDERS_ORDERED)
+
+# Detectors running at once: the next candidate overlaps the current one, and
+# the rest wait in registry order so a match cancels them before they start
+_DETECTOR_WORKERS = 2
+
+
+def _dumps_json(data: dict) -> str:
+    """Serialize data as 2-space indented JSON, with orjson when it is installed"""
+    try:
+        import orjson
+    except ImportError:  # Optional speedup, falls back to stdlib json
+        import json
+        return json.dumps(data, indent=2, default=str, ensure_ascii=False)
+    return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2).decode()
+
+
+def _print_json(data: dict) -> None:
+    """
+    Pretty-print data as JSON
+
+    Highlighted through rich on a terminal; written straight to stdout
+    otherwise (e.g. piped to jq), where rich would only strip the colors.
+    """
+    content = _dumps_json(data)
+    if not console.is_terminal:
+        sys.stdout.write(content + '\n')
+        return
+
+    from rich.highlighter import JSONHighlighter
+    from rich.text import Text
+
+    # console.print_json would re-parse and re-dump the string, so highlight it directly
+    text = JSONHighlighter()(Text(content, no_wrap=True))
+    text.overflow = None
+    console.print(text, soft_wrap=True)
+
+
+def _run_detectors(
+        project_path: Path,
+        frameworks_to_try: List[str],
+        snapshot: Optional['ProjectSnapshot'] = None
+) -> Tuple[Optional[str], Optional[Dict]]:
+    """
+    Run framework detectors concurrently and accept the first match in registry order
+
+    Detection is mostly stat/read calls, so threads overlap the I/O. Detectors are
+    queued in frameworks_to_try order (specific before generic) on a small pool
+    and their results consumed in that order; once one is accepted, every queued
+    detector is cancelled, so at most one lower-priority detector ever runs
+    past the match. All detectors share one ProjectSnapshot, so the tree is
+    walked and each file read only once.
+    When several frameworks are tried, detectors that the project's top-level
+    manifests rule out are skipped entirely.
+
+    Args:
+        project_path: Resolved project directory
+        frameworks_to_try: Framework names in registry order
+        snapshot: Snapshot already taken of the project (e.g. for the cache
+            fingerprint); a new one is built if not given
+
+    Returns:
+        (framework name, detection result), or (None, None) if nothing matched
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from core.project_snapshot import ProjectSnapshot
+    from frameworks import load_detector
+    from frameworks._triage import triage
+
+    if snapshot is None:
+        snapshot = ProjectSnapshot(project_path)
+    if len(frameworks_to_try) > 1:
+        frameworks_to_try = triage(frameworks_to_try, snapshot.entries)
+        if not frameworks_to_try:
+            return None, None
+
+    detectors = [
+        (fw_name, load_detector(fw_name)(project_path, snapshot))
+        for fw_name in frameworks_to_try
+    ]
+    if len(detectors) == 1:
+        fw_name, detector = detectors[0]
+        console.print(f"   Trying {fw_name}...", style="dim")
+        result = detector.detect()
+        return (fw_name, result) if result is not None else (None, None)
+
+    executor = ThreadPoolExecutor(max_workers=min(len(detectors), _DETECTOR_WORKERS))
+    futures = [(fw_name, executor.submit(detector.detect)) for fw_name, detector in detectors]
+    try:
+        for fw_name, future in futures:
+            console.print(f"   Trying {fw_name}...", style="dim")
+            result = future.result()
+            if result is not None:
+                return fw_name, result
+        return None, None
+    finally:
+        for _, future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def _detect_project(
+        project_path: Path,
+        frameworks_to_try: List[str],
+        use_cache: bool
+) -> Tuple[Optional[str], Optional[Dict]]:
+    """
+    Detect the project framework, reusing a fresh on-disk result when allowed
+
+    Returns:
+        (framework name, detection result), or (None, None) if nothing matched
+    """
+    if not use_cache:
+        return _run_detectors(project_path, frameworks_to_try)
+
+    from core import detection_cache
+    from core.project_snapshot import ProjectSnapshot
+
+    # Taken once, before detection: it validates the cache and keys the new
+    # entry, and its tree walk is the one the detectors reuse on a miss
+    snapshot = ProjectSnapshot(project_path)
+    current = detection_cache.fingerprint(project_path, snapshot)
+    if current is not None:
+        cached = detection_cache.load(project_path, frameworks_to_try, current)
+        if cached is not None:
+            console.print("   Using cached detection result", style="dim")
+            return cached
+
+    fw_name, result = _run_detectors(project_path, frameworks_to_try, snapshot)
+    if result is not None and current is not None:
+        detection_cache.save(project_path, frameworks_to_try, fw_name, result, current)
+    return fw_name, result
+
 
 @app.command()
 def init(
@@ -50,6 +196,17 @@ def init(
         "-cp",
         help="Cloud provider for deployment. Options: local | aws | azure | gcp"
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Ignore cached detection results and re-run the detectors"
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="Show the full stack trace when generation fails"
+    ),
 ):
     """
     Initialize CI/CD pipeline for a project.
@@ -76,78 +233,65 @@ def init(
         # Deploy to Azure as a VM instance
         $ cicd-framework init --cloud-provider azure --deployment-type instance
     """
+    from frameworks import AVAILABLE_FRAMEWORKS, FRAMEWORK_NAMES, load_generator
+
     console.print("🔍 Detecting project framework...\n")
 
-    project_path = Path(path).resolve()
+    # typer already hands us a Path; resolve it once and keep both forms
+    project_path = path.resolve()
+    project_path_str = str(project_path)
 
     # Parse and validate platforms
-    requested_platforms = [p.strip().lower() for p in platforms.split(',')]
-    valid_platforms = ['jenkins', 'gitlab', 'github']
-    invalid = [p for p in requested_platforms if p not in valid_platforms]
+    # dict.fromkeys drops repeats (jenkins,jenkins) while keeping the given order
+    requested_platforms = list(dict.fromkeys(p.strip().lower() for p in platforms.split(',')))
+    invalid = [p for p in requested_platforms if p not in _VALID_PLATFORMS]
 
     if invalid:
         console.print(f"[red]✗ Invalid platforms: {', '.join(invalid)}[/red]")
-        console.print(f"[yellow]Valid platforms: {', '.join(valid_platforms)}[/yellow]")
+        console.print(f"[yellow]Valid platforms: {', '.join(_PLATFORMS_ORDERED)}[/yellow]")
         console.print("\n[dim]Tip: Use comma-separated values like --platforms jenkins,gitlab,github[/dim]")
         raise typer.Exit(code=1)
 
     # Validate deployment type
     deployment_type = deployment_type.lower()
-    valid_deployment_types = ['webapp', 'instance']
-    if deployment_type not in valid_deployment_types:
+    if deployment_type not in _VALID_DEPLOYMENT_TYPES:
         console.print(f"[red]✗ Invalid deployment type: {deployment_type}[/red]")
-        console.print(f"[yellow]Valid deployment types: {', '.join(valid_deployment_types)}[/yellow]")
+        console.print(f"[yellow]Valid deployment types: {', '.join(_DEPLOYMENT_TYPES_ORDERED)}[/yellow]")
         raise typer.Exit(code=1)
 
     # Validate cloud provider
     cloud_provider = cloud_provider.lower()
-    valid_cloud_providers = ['local', 'aws', 'azure', 'gcp']
-    if cloud_provider not in valid_cloud_providers:
+    if cloud_provider not in _VALID_CLOUD_PROVIDERS:
         console.print(f"[red]✗ Invalid cloud provider: {cloud_provider}[/red]")
-        console.print(f"[yellow]Valid cloud providers: {', '.join(valid_cloud_providers)}[/yellow]")
+        console.print(f"[yellow]Valid cloud providers: {', '.join(_CLOUD_PROVIDERS_ORDERED)}[/yellow]")
         raise typer.Exit(code=1)
 
     # If user specified framework, use only that
     if framework:
         if framework not in AVAILABLE_FRAMEWORKS:
             console.print(f"[red]✗ Unknown framework: {framework}[/red]")
-            console.print(f"[yellow]Available frameworks: {', '.join(AVAILABLE_FRAMEWORKS.keys())}[/yellow]")
+            console.print(f"[yellow]Available frameworks: {', '.join(FRAMEWORK_NAMES)}[/yellow]")
             raise typer.Exit(code=1)
 
         frameworks_to_try = [framework]
     else:
         # Try all available frameworks
-        frameworks_to_try = list(AVAILABLE_FRAMEWORKS.keys())
+        frameworks_to_try = list(FRAMEWORK_NAMES)
 
     # Try each framework detector
-    detection_result = None
-    detected_framework = None
-
-    for fw_name in frameworks_to_try:
-        fw_config = AVAILABLE_FRAMEWORKS[fw_name]
-        DetectorClass = fw_config['detector']
-
-        console.print(f"   Trying {fw_name}...", style="dim")
-
-        # Initialize detector and try detection
-        detector = DetectorClass(project_path)
-        result = detector.detect()
-
-        if result is not None:
-            detection_result = result
-            detected_framework = fw_name
-            console.print(f"[green]✓ Detected: {fw_name}[/green]")
-            break
+    detected_framework, detection_result = _detect_project(project_path, frameworks_to_try, not no_cache)
+    if detection_result is not None:
+        console.print(f"[green]✓ Detected: {detected_framework}[/green]")
 
     # Check if detection failed
     if detection_result is None:
         console.print("[red]✗ No supported framework detected![/red]")
-        console.print(f"[yellow]Supported frameworks: {', '.join(AVAILABLE_FRAMEWORKS.keys())}[/yellow]")
+        console.print(f"[yellow]Supported frameworks: {', '.join(FRAMEWORK_NAMES)}[/yellow]")
         console.print("\n[dim]Tip: Use --framework to force a specific framework[/dim]")
         raise typer.Exit(code=1)
 
     # Add project path to result
-    detection_result['project_path'] = str(project_path)
+    detection_result['project_path'] = project_path_str
 
     # Add deployment configuration
     detection_result['deployment_type'] = deployment_type
@@ -155,9 +299,7 @@ def init(
 
     # Display detection results
     console.print()
-    table = Table(title="📊 Detection Results", show_header=True, header_style="bold cyan")
-    table.add_column("Property", style="cyan", no_wrap=True)
-    table.add_column("Value", style="green")
+    table = _new_table("📊 Detection Results", "bold cyan", (("Property", "cyan"), ("Value", "green")))
 
     table.add_row("Framework", detected_framework)
     table.add_row("Language", detection_result.get("language", "N/A"))
@@ -185,7 +327,7 @@ def init(
     console.print(f"[bold]📦 Generating CI/CD files for: {platforms_display}[/bold]\n")
 
     # Get the appropriate generator
-    GeneratorClass = AVAILABLE_FRAMEWORKS[detected_framework]['generator']
+    GeneratorClass = load_generator(detected_framework)
     generator = GeneratorClass()
 
     try:
@@ -194,9 +336,7 @@ def init(
         console.print("[green]✅ Generation successful![/green]\n")
 
         # Display generated files
-        files_table = Table(title="📄 Generated Files", show_header=True, header_style="bold green")
-        files_table.add_column("Platform", style="cyan", no_wrap=True)
-        files_table.add_column("File Path", style="yellow")
+        files_table = _new_table("📄 Generated Files", "bold green", (("Platform", "cyan"), ("File Path", "yellow")))
 
         for platform, file_path in files['generated_files'].items():
             # Make path relative to project for cleaner display
@@ -210,11 +350,16 @@ def init(
         console.print()
 
         return files
+    except typer.Exit:
+        raise
     except Exception as e:
         console.print(f"[red]✗ Generation failed: {e}[/red]")
-        import traceback
-        console.print("\n[dim]Stack trace:[/dim]")
-        traceback.print_exc()
+        if verbose:
+            import traceback
+            console.print("\n[dim]Stack trace:[/dim]")
+            traceback.print_exc()
+        else:
+            console.print("[dim]Run with --verbose for the full stack trace[/dim]")
         raise typer.Exit(code=1)
 
 
@@ -234,6 +379,11 @@ def detect(
         "-f",
         help="Force specific framework detection"
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Ignore cached detection results and re-run the detectors"
+    ),
 ):
     """
     Detect project configuration without generating files.
@@ -248,7 +398,10 @@ def detect(
         # Force Python detection
         $ cicd-framework detect --framework python
     """
-    project_path = Path(path).resolve()
+    from frameworks import AVAILABLE_FRAMEWORKS, FRAMEWORK_NAMES
+
+    project_path = path.resolve()
+    project_path_str = str(project_path)
 
     console.print("🔍 Detecting project framework...\n")
 
@@ -256,68 +409,95 @@ def detect(
     if framework:
         if framework not in AVAILABLE_FRAMEWORKS:
             console.print(f"[red]✗ Unknown framework: {framework}[/red]")
-            console.print(f"[yellow]Available frameworks: {', '.join(AVAILABLE_FRAMEWORKS.keys())}[/yellow]")
+            console.print(f"[yellow]Available frameworks: {', '.join(FRAMEWORK_NAMES)}[/yellow]")
             raise typer.Exit(code=1)
         frameworks_to_try = [framework]
     else:
-        frameworks_to_try = list(AVAILABLE_FRAMEWORKS.keys())
+        frameworks_to_try = list(FRAMEWORK_NAMES)
 
     # Try each framework
-    for fw_name in frameworks_to_try:
-        fw_config = AVAILABLE_FRAMEWORKS[fw_name]
-        DetectorClass = fw_config['detector']
-
-        console.print(f"   Trying {fw_name}...", style="dim")
-        detector = DetectorClass(project_path)
-        result = detector.detect()
-
-        if result is not None:
-            result['project_path'] = str(project_path)
-            result['detected_framework'] = fw_name
-            console.print(f"\n[green]✓ Detected: {fw_name}[/green]\n")
-            console.print_json(data=result)
-            return result
+    fw_name, result = _detect_project(project_path, frameworks_to_try, not no_cache)
+    if result is not None:
+        result['project_path'] = project_path_str
+        result['detected_framework'] = fw_name
+        console.print(f"\n[green]✓ Detected: {fw_name}[/green]\n")
+        _print_json(result)
+        return result
 
     console.print("[red]✗ No supported framework detected![/red]")
-    console.print(f"[yellow]Supported frameworks: {', '.join(AVAILABLE_FRAMEWORKS.keys())}[/yellow]")
+    console.print(f"[yellow]Supported frameworks: {', '.join(FRAMEWORK_NAMES)}[/yellow]")
     raise typer.Exit(code=1)
 
 
-@app.command(name="list")
-def list_frameworks():
+def _new_table(title: str, header_style: str, columns: Tuple[Tuple[str, str], ...]):
     """
-    List all supported frameworks and platforms.
-
-    Shows available framework detectors and generators.
+    Create a rich Table with (header, style) columns; the first column never wraps
     """
-    console.print("\n[bold cyan]🚀 CI/CD Framework Generator[/bold cyan]\n")
+    from rich.table import Table
 
-    # Frameworks table
-    frameworks_table = Table(title="Supported Frameworks", show_header=True, header_style="bold cyan")
-    frameworks_table.add_column("Framework", style="cyan", no_wrap=True)
-    frameworks_table.add_column("Detector", style="yellow")
-    frameworks_table.add_column("Generator", style="green")
+    table = Table(title=title, show_header=True, header_style=header_style)
+    for index, (header, style) in enumerate(columns):
+        table.add_column(header, style=style, no_wrap=index == 0)
+    return table
 
+
+@lru_cache(maxsize=None)
+def _list_tables() -> tuple:
+    """Frameworks and platforms tables for `list`, built once (their content is static)"""
+    from frameworks import AVAILABLE_FRAMEWORKS
+
+    frameworks_table = _new_table(
+        "Supported Frameworks", "bold cyan",
+        (("Framework", "cyan"), ("Detector", "yellow"), ("Generator", "green"))
+    )
     for fw_name, fw_config in AVAILABLE_FRAMEWORKS.items():
         frameworks_table.add_row(
             fw_name.upper(),
-            fw_config['detector'].__name__,
-            fw_config['generator'].__name__
+            fw_config['detector'].rsplit(':', 1)[1],
+            fw_config['generator'].rsplit(':', 1)[1]
         )
 
-    console.print(frameworks_table)
-    console.print()
-
-    # Platforms table
-    platforms_table = Table(title="Supported CI/CD Platforms", show_header=True, header_style="bold green")
-    platforms_table.add_column("Platform", style="green", no_wrap=True)
-    platforms_table.add_column("File Generated", style="yellow")
-    platforms_table.add_column("Description", style="dim")
-
+    platforms_table = _new_table(
+        "Supported CI/CD Platforms", "bold green",
+        (("Platform", "green"), ("File Generated", "yellow"), ("Description", "dim"))
+    )
     platforms_table.add_row("Jenkins", "Jenkinsfile", "Declarative pipeline for Jenkins")
     platforms_table.add_row("GitLab CI", ".gitlab-ci.yml", "GitLab CI/CD configuration")
     platforms_table.add_row("GitHub Actions", ".github/workflows/ci.yml", "GitHub Actions workflow")
 
+    return frameworks_table, platforms_table
+
+
+@lru_cache(maxsize=None)
+def _options_tables() -> tuple:
+    """Cloud provider and deployment type tables for `options`, built once"""
+    providers_table = _new_table("Cloud Providers", "bold cyan", (("Value", "green"), ("Description", "yellow")))
+    providers_table.add_row("local", "Local Docker Registry (default)")
+    providers_table.add_row("aws", "Amazon Web Services")
+    providers_table.add_row("azure", "Microsoft Azure")
+    providers_table.add_row("gcp", "Google Cloud Platform")
+
+    types_table = _new_table("Deployment Types", "bold green", (("Value", "green"), ("Description", "yellow")))
+    types_table.add_row("webapp", "Web Application/Service (default)")
+    types_table.add_row("instance", "VM/Container Instance")
+
+    return providers_table, types_table
+
+
+@app.command(name="list")
+def list_frameworks():
+    """
+    List all supported frameworks and platforms.
+
+    Shows available framework detectors and generators.
+    """
+    console.print("\n[bold cyan]🚀 CI/CD Framework Generator[/bold cyan]\n")
+
+    frameworks_table, platforms_table = _list_tables()
+
+    console.print(frameworks_table)
+    console.print()
+
     console.print(platforms_table)
     console.print()
 
@@ -327,10 +507,9 @@ def version():
     """
     Show version information.
     """
-    console.print("\n[bold cyan]CI/CD Framework Generator[/bold cyan]")
-    console.print("[dim]Version:[/dim] [green]1.0.0[/green]")
-    console.print("[dim]Author:[/dim] [yellow]Ayoub Jedidi[/yellow]")
-    console.print()
+    from cli.launcher import print_version
+
+    print_version()
 
 
 @app.command()
@@ -340,27 +519,11 @@ def options():
     """
     console.print("\n[bold cyan]🚀 Available Deployment Options[/bold cyan]\n")
 
-    # Cloud Providers table
-    providers_table = Table(title="Cloud Providers", show_header=True, header_style="bold cyan")
-    providers_table.add_column("Value", style="green", no_wrap=True)
-    providers_table.add_column("Description", style="yellow")
-
-    providers_table.add_row("local", "Local Docker Registry (default)")
-    providers_table.add_row("aws", "Amazon Web Services")
-    providers_table.add_row("azure", "Microsoft Azure")
-    providers_table.add_row("gcp", "Google Cloud Platform")
+    providers_table, types_table = _options_tables()
 
     console.print(providers_table)
     console.print()
 
-    # Deployment Types table
-    types_table = Table(title="Deployment Types", show_header=True, header_style="bold green")
-    types_table.add_column("Value", style="green", no_wrap=True)
-    types_table.add_column("Description", style="yellow")
-
-    types_table.add_row("webapp", "Web Application/Service (default)")
-    types_table.add_row("instance", "VM/Container Instance")
-
     console.print(types_table)
     console.print()
 
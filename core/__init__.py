@@ -1,3 +1,9 @@
-from .base_detector import BaseDetector
-from .base_generator import BaseGenerator
-__all__ = ['BaseDetector', 'BaseGenerator']
+from ._lazy import lazy_exports
+
+_EXPORTS = {
+    'BaseDetector': '.base_detector',
+    'BaseGenerator': '.base_generator',
+    'ProjectSnapshot': '.project_snapshot',
+}
+__getattr__ = lazy_exports(__name__, _EXPORTS)
+__all__ = list(_EXPORTS)
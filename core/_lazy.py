@@ -0,0 +1,24 @@
+"""
+Lazy package exports (PEP 562)
+Lets a package __init__ re-export classes without importing their modules
+until first access - detection then never loads Jinja2 and the generators.
+"""
+import importlib
+from typing import Callable, Dict
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Callable[[str], object]:
+    """
+    Build a module-level __getattr__ that imports exported names on demand
+
+    Args:
+        package: The package's __name__
+        exports: Exported name -> relative module defining it (e.g. '.detector')
+    """
+    def __getattr__(name: str) -> object:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        return getattr(importlib.import_module(module, package), name)
+
+    return __getattr__
@@ -2,22 +2,76 @@
 Base Detector class for all framework detectors
 Provides common utilities for file checking, reading, and dependency parsing
 """
+import os
 import re
+from collections import Counter
+from fnmatch import fnmatchcase
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Set, Dict
+from typing import TYPE_CHECKING, Optional, Dict, FrozenSet, Iterator, Pattern, Union
+
+if TYPE_CHECKING:
+    from .project_snapshot import ProjectSnapshot
+
+# Directories that never hold project sources - never descended into
+EXCLUDED_DIRS = frozenset({
+    '.git', 'venv', '.venv', 'node_modules', '__pycache__', '.tox', 'dist', 'build',
+})
+
+# Splits a requirement line at its version specifier
+_DEP_SPLIT_RE = re.compile(r'[=<>~!]')
+
+
+def read_text(root: str, filename: str) -> Optional[str]:
+    """
+    Read a project file as UTF-8 (undecodable bytes replaced)
+
+    Returns:
+        File content, or None if the file cannot be read
+    """
+    try:
+        with open(os.path.join(root, filename), 'r', encoding='utf-8', errors='replace') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _compiled(pattern: str) -> Pattern:
+    """Compile a regex pattern string once per process"""
+    return re.compile(pattern)
 
 
 class BaseDetector:
     """Base class for framework-specific detectors"""
 
-    def __init__(self, project_path: Path):
+    # Fixed attribute set: no per-instance __dict__ (subclasses declare their own)
+    __slots__ = (
+        'project_path', '_root', 'snapshot',
+        '_file_cache', '_dep_cache', '_extension_counts', '_entry_names',
+    )
+
+    def __init__(self, project_path: Path, snapshot: Optional['ProjectSnapshot'] = None):
         """
         Initialize detector with project path
 
         Args:
             project_path: Path to the project to detect
+            snapshot: Shared view of the project; when given, entries, file
+                contents and extension lookups come from it instead of disk
         """
         self.project_path = Path(project_path)
+        # String form for os.path probes, so hot methods build no Path objects
+        self._root = str(self.project_path)
+        self.snapshot = snapshot
+        # filename -> content (None when missing), filled on first read
+        self._file_cache: Dict[str, Optional[str]] = {}
+        # filename -> parsed dependency names, filled on first parse
+        self._dep_cache: Dict[str, FrozenSet[str]] = {}
+        # lowercase extension -> file count, filled on first extension query
+        self._extension_counts: Optional[Counter] = None
+        # top-level entry names, filled on first lookup
+        self._entry_names: Optional[FrozenSet[str]] = None
 
     def detect(self) -> Optional[Dict]:
         """
@@ -30,24 +84,114 @@ class BaseDetector:
 
     # ============ Shared File Utilities ============
 
+    @property
+    def _entries(self) -> FrozenSet[str]:
+        """Names of all top-level project entries, collected with one scandir"""
+        if self._entry_names is None:
+            if self.snapshot is not None:
+                self._entry_names = self.snapshot.entries
+            else:
+                try:
+                    with os.scandir(self._root) as entries:
+                        self._entry_names = frozenset(entry.name for entry in entries)
+                except OSError:
+                    self._entry_names = frozenset()
+        return self._entry_names
+
     def file_exists(self, filename: str) -> bool:
         """Check if a file exists in project"""
-        return (self.project_path / filename).exists()
+        if '/' not in filename:
+            return filename in self._entries
+        return os.path.exists(os.path.join(self._root, filename))
 
     def read_file(self, filename: str) -> str:
         """Read file content safely"""
-        try:
-            file_path = self.project_path / filename
-            if file_path.exists():
-                return file_path.read_text()
-        except Exception:
-            pass
-        return ""
+        content = self._read(filename)
+        return content if content is not None else ""
+
+    def _read(self, filename: str) -> Optional[str]:
+        """
+        Read a project file once per detector instance
+
+        Returns:
+            File content, or None if the file is missing or unreadable
+        """
+        if filename not in self._file_cache:
+            if self.snapshot is not None:
+                content = self.snapshot.read(filename)
+            elif '/' in filename or filename in self._entries:
+                # Nested paths skip the exists() stat: a failed open means missing
+                content = read_text(self._root, filename)
+            else:
+                content = None
+            self._file_cache[filename] = content
+        return self._file_cache[filename]
 
     def has_files_with_extension(self, extension: str) -> bool:
-        """Check if project has files with given extension"""
-        pattern = f"*.{extension}" if not extension.startswith('*') else extension
-        return bool(list(self.project_path.rglob(pattern)))
+        """
+        Check if project has files with given extension (case-insensitive)
+
+        Args:
+            extension: Extension with or without the glob prefix ('py', '*.py')
+        """
+        suffix = '.' + extension.lstrip('*.').lower()
+        if self._extension_counts is not None or self.snapshot is not None:
+            return self.extension_counts()[suffix] > 0
+
+        # Nothing counted yet: stop the walk at the first match instead
+        return next(self.iter_files('*' + suffix, ignore_case=True), None) is not None
+
+    def extension_counts(self) -> Counter:
+        """
+        Number of project files per lowercase extension (e.g. {'.py': 12})
+
+        Counted once per detector from the snapshot's files_by_extension, so
+        every extension query a detector makes shares one pass over the tree.
+        A detector created without a snapshot builds its own on first use.
+        """
+        if self._extension_counts is None:
+            if self.snapshot is None:
+                # Imported here: project_snapshot itself imports this module
+                from .project_snapshot import ProjectSnapshot
+                self.snapshot = ProjectSnapshot(self.project_path)
+            self._extension_counts = Counter(
+                {ext: len(paths) for ext, paths in self.snapshot.files_by_extension.items()}
+            )
+        return self._extension_counts
+
+    def iter_files(self, pattern: str, ignore_case: bool = False) -> Iterator[Path]:
+        """
+        Lazily yield project files whose name matches a glob pattern
+
+        Walks the tree with os.scandir and never enters EXCLUDED_DIRS,
+        so callers that only need the first hit can stop early.
+
+        Args:
+            pattern: Glob pattern matched against file names (e.g., '*.py')
+            ignore_case: Match names case-insensitively ('*.py' also finds 'A.PY')
+        """
+        if ignore_case:
+            pattern = pattern.lower()
+
+        if self.snapshot is not None:
+            for path in self.snapshot.files_with_extension(os.path.splitext(pattern)[1].lower()):
+                name = os.path.basename(path)
+                if fnmatchcase(name.lower() if ignore_case else name, pattern):
+                    yield Path(path)
+            return
+
+        stack = [self._root]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in EXCLUDED_DIRS:
+                                stack.append(entry.path)
+                        elif fnmatchcase(entry.name.lower() if ignore_case else entry.name, pattern):
+                            yield Path(entry.path)
+            except OSError:
+                continue
 
     # ============ Shared Version Detection ============
 
@@ -61,41 +205,69 @@ class BaseDetector:
             return f"{parts[0]}.{parts[1]}"
         return version
 
-    def extract_version_from_content(self, content: str, pattern: str) -> Optional[str]:
+    def extract_version_from_content(self, content: str, pattern: Union[str, Pattern]) -> Optional[str]:
         """
         Extract version using regex pattern
 
         Args:
             content: File content to search
-            pattern: Regex pattern with one capture group for version
+            pattern: Regex pattern (string or precompiled) with one capture group for version
         """
-        match = re.search(pattern, content)
+        if isinstance(pattern, str):
+            pattern = _compiled(pattern)
+        match = pattern.search(content)
         if match:
             return self.normalize_version(match.group(1))
         return None
 
     # ============ Shared Dependency Parsing ============
 
-    def parse_dependencies_from_file(self, filename: str) -> Set[str]:
+    def parse_dependencies_from_file(self, filename: str) -> FrozenSet[str]:
         """
         Parse dependencies from a requirements-style file
-        Returns set of lowercase package names
+        Returns set of lowercase package names (parsed once per detector instance)
         """
+        deps = self._dep_cache.get(filename)
+        if deps is None:
+            deps = self._dep_cache[filename] = self._compute_deps(filename)
+        return deps
+
+    def _compute_deps(self, filename: str) -> FrozenSet[str]:
+        """Parse a requirements-style file into lowercase package names"""
         deps = set()
-        content = self.read_file(filename)
+        split = _DEP_SPLIT_RE.split
 
-        for line in content.split('\n'):
-            line = line.strip().lower()
+        for line in self._iter_file_lines(filename):
+            line = line.strip()
             # Skip comments and empty lines
-            if not line or line.startswith('#') or line.startswith('-r'):
+            if not line or line[0] == '#' or line.startswith('-r'):
                 continue
 
             # Extract package name (before ==, >=, etc.)
-            pkg = re.split(r'[=<>~!]', line)[0].strip()
+            pkg = split(line, 1)[0].strip().lower()
             if pkg:
                 deps.add(pkg)
 
-        return deps
+        return frozenset(deps)
+
+    def _iter_file_lines(self, filename: str) -> Iterator[str]:
+        """
+        Yield the lines of a project file
+
+        Content already read (or held by the snapshot) is reused; otherwise the
+        file is streamed from disk without keeping it in memory.
+        """
+        if filename in self._file_cache or self.snapshot is not None:
+            yield from self.read_file(filename).splitlines()
+            return
+
+        if not self.file_exists(filename):
+            return
+        try:
+            with open(os.path.join(self._root, filename), 'r', encoding='utf-8', errors='replace') as f:
+                yield from f
+        except OSError:
+            return
 
     def check_dependency_in_files(self, dependency: str, *filenames) -> bool:
         """
@@ -106,8 +278,4 @@ class BaseDetector:
             *filenames: Variable number of filenames to check
         """
         dependency = dependency.lower()
-        for filename in filenames:
-            deps = self.parse_dependencies_from_file(filename)
-            if dependency in deps:
-                return True
-        return False
\ No newline at end of file
+        return any(dependency in self.parse_dependencies_from_file(filename) for filename in filenames)
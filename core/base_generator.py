@@ -3,37 +3,239 @@ Base Generator class for all framework generators
 Provides common utilities for template rendering and file generation
 """
 import os
+import re
+import stat
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
+from types import MappingProxyType
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+from jinja2.bccache import Bucket
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Container, Iterator, List, Mapping, Optional, Tuple
+
+from .detection_cache import CACHE_DIR
+
+# Generation-run time: one timestamp shared by every file generated in this process
+_RUN_TIMESTAMP = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+# Templates with a larger source are streamed to disk instead of rendered in memory
+_STREAM_THRESHOLD = 64 * 1024
+
+# Rendered chunks joined per file write when streaming (Jinja2 yields many tiny ones)
+_STREAM_BUFFER_SIZE = 64
+
+# Output is written to a fresh temp file next to the target, then renamed over it
+_TEMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_CLOEXEC', 0)
+
+# Upper bound on threads generating platform files concurrently
+_MAX_PLATFORM_WORKERS = 8
+
+# A bare {{ name }} substitution - the only tag plain templates may contain
+_PLAIN_VAR_RE = re.compile(r'\{\{\s*([A-Za-z_]\w*)\s*\}\}')
+
+Renderer = Callable[[Dict[str, Any]], str]
+
+
+def _compile_plain(source: str, env_globals: Container[str]) -> Optional[Renderer]:
+    """
+    Compile a template that only substitutes bare {{ name }} variables
+
+    Args:
+        source: Template source
+        env_globals: Names the Jinja2 environment resolves when the context lacks them
+
+    Returns:
+        A function rendering what Jinja2 would for a context of plain values
+        (values through str(), undefined names as '', one trailing newline
+        dropped), or None if the template has blocks, comments, expressions
+        or names of environment globals such as range, and needs Jinja2
+    """
+    if '{%' in source or '{#' in source:
+        return None
+
+    source = source.replace('\r\n', '\n').replace('\r', '\n')
+    if source.endswith('\n'):
+        source = source[:-1]  # Jinja2 default: keep_trailing_newline=False
+
+    parts = _PLAIN_VAR_RE.split(source)
+    literals, names = parts[0::2], parts[1::2]
+    if any('{{' in literal for literal in literals):
+        return None
+
+    if any(name in env_globals for name in names):
+        return None
+
+    pairs = tuple(zip(names, literals[1:]))
+    head = literals[0]
+
+    def render(context: Dict[str, Any]) -> str:
+        out = [head]
+        for name, literal in pairs:
+            if name in context:
+                out.append(str(context[name]))
+            out.append(literal)
+        return ''.join(out)
+
+    return render
+
+
+class _BestEffortBytecodeCache(FileSystemBytecodeCache):
+    """
+    Bytecode cache that never fails a render
+
+    A cache file that cannot be read or written (read-only or foreign-owned
+    cache dir, full disk, truncated file) only means the template is
+    compiled from source again.
+    """
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        try:
+            super().load_bytecode(bucket)
+        except (OSError, EOFError, ValueError):
+            bucket.reset()
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        try:
+            super().dump_bytecode(bucket)
+        except OSError:
+            pass
+
+
+@contextmanager
+def _replacing(output_path: Path) -> Iterator[int]:
+    """
+    Open a temp file next to output_path and move it into place on success
+
+    Yields the temp file's descriptor. Only if the block completes is the
+    temp file renamed over output_path (keeping an existing file's mode);
+    on any error it is removed and output_path is left exactly as it was.
+    """
+    directory, name = os.path.split(os.fspath(output_path))
+    while True:
+        tmp_path = os.path.join(directory, f".{name}.{os.urandom(4).hex()}.tmp")
+        try:
+            fd = os.open(tmp_path, _TEMP_FLAGS, 0o666)
+            break
+        except FileExistsError:
+            continue
+
+    try:
+        try:
+            try:
+                os.chmod(tmp_path, stat.S_IMODE(os.stat(output_path).st_mode))
+            except FileNotFoundError:
+                pass  # New file: 0o666 minus the umask, as a plain open would give
+            yield fd
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
 
 
 class BaseGenerator:
     """Base class for framework-specific generators"""
     SUPPORTED_PLATFORMS = ['jenkins', 'gitlab', 'github']
 
-    def __init__(self, framework_name: str):
+    # Fixed attribute set: no per-instance __dict__ (subclasses declare their own)
+    __slots__ = (
+        'framework_name', 'templates_dir', 'jinja_env', 'verbose',
+        '_templates', '_template_sizes', '_renderers', '_template_names',
+    )
+
+    # platform -> {'template': ..., 'output': ...}, defined once per subclass
+    # and frozen into read-only mappings when the subclass is created
+    PLATFORM_TEMPLATE_MAP: Mapping[str, Mapping[str, str]] = MappingProxyType({})
+
+    # framework name -> (Jinja2 environment, preloaded templates, template sizes, plain renderers)
+    _ENV_CACHE: Dict[str, Tuple[Environment, Dict[str, Template], Dict[str, int], Dict[str, Renderer]]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Shared by every instance and thread: freeze it so no caller can mutate it
+        template_map = cls.__dict__.get('PLATFORM_TEMPLATE_MAP')
+        if template_map is not None and not isinstance(template_map, MappingProxyType):
+            cls.PLATFORM_TEMPLATE_MAP = MappingProxyType({
+                platform: MappingProxyType(dict(config)) for platform, config in template_map.items()
+            })
+
+    def __init__(self, framework_name: str, verbose: bool = True):
         """
         Initialize generator for a specific framework
 
         Args:
             framework_name: Name of the framework (e.g., 'python', 'node')
+            verbose: Print generation progress (False keeps batch runs silent)
         """
         self.framework_name = framework_name
+        self.verbose = verbose
 
         # Build path to framework templates
         # Assumes structure: frameworks/{framework_name}/templates/
         base_path = Path(__file__).parent.parent  # Go up from core/ to project root
         self.templates_dir = base_path / 'frameworks' / framework_name / 'templates'
 
-        # Setup Jinja2 environment
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(str(self.templates_dir)),
+        # Jinja2 environment and preloaded templates are shared by every
+        # generator instance of the same framework within the process
+        cached = BaseGenerator._ENV_CACHE.get(framework_name)
+        if cached is None:
+            cached = BaseGenerator._ENV_CACHE[framework_name] = self._load_environment(self.templates_dir)
+        self.jinja_env, self._templates, self._template_sizes, self._renderers = cached
+        self._template_names = frozenset(self._templates)
+
+    @staticmethod
+    def _load_environment(
+            templates_dir: Path
+    ) -> Tuple[Environment, Dict[str, Template], Dict[str, int], Dict[str, Renderer]]:
+        """
+        Build the Jinja2 environment for a templates dir and preload its templates
+
+        Templates that only substitute bare {{ name }} variables also get a
+        plain string renderer, which skips Jinja2's per-render machinery.
+
+        Returns:
+            (environment, template name -> Template, template name -> source size,
+             template name -> plain renderer)
+        """
+        # Compiled templates are cached across runs in the per-user cache dir,
+        # falling back to the system temp dir when it cannot be created or written
+        bytecode_dir = CACHE_DIR / 'jinja'
+        try:
+            bytecode_dir.mkdir(parents=True, exist_ok=True)
+            writable = os.access(bytecode_dir, os.W_OK)
+        except OSError:
+            writable = False
+        if writable:
+            bytecode_cache = _BestEffortBytecodeCache(str(bytecode_dir))
+        else:
+            bytecode_cache = _BestEffortBytecodeCache()
+
+        env = Environment(
+            loader=FileSystemLoader(str(templates_dir)),
+            bytecode_cache=bytecode_cache,
+            auto_reload=False,
             trim_blocks=True,
             lstrip_blocks=True
         )
 
+        # Preload top-level templates so rendering skips lookup and parsing
+        templates: Dict[str, Template] = {}
+        sizes: Dict[str, int] = {}
+        renderers: Dict[str, Renderer] = {}
+        for path in templates_dir.glob('*.j2'):
+            templates[path.name] = env.get_template(path.name)
+            sizes[path.name] = path.stat().st_size
+            renderer = _compile_plain(path.read_text(encoding='utf-8'), env.globals)
+            if renderer is not None:
+                renderers[path.name] = renderer
+        return env, templates, sizes, renderers
+
     def generate(self, detection_result: Dict, output_dir: Path, platforms: list = None) -> Dict:
         """
         Main generation method - must be overridden by child classes
@@ -47,10 +249,16 @@ class BaseGenerator:
         """
         raise NotImplementedError("Subclasses must implement generate()")
 
+    @staticmethod
+    def _as_path(value: Any) -> Path:
+        """Return value as a Path, without rebuilding one that already is"""
+        return value if isinstance(value, Path) else Path(value)
+
     # ============ Shared Template Rendering ============
-    def get_platform_template_map(self) -> Dict[str, Dict]:
+    def get_platform_template_map(self) -> Mapping[str, Mapping[str, str]]:
         """
-        Override in child classes to define platform-specific templates
+        Platform-specific templates, taken from the class-level PLATFORM_TEMPLATE_MAP
+        (set it in child classes, or override this method)
 
         Returns:
             {
@@ -59,7 +267,7 @@ class BaseGenerator:
                 'github': {'template': 'github-actions.yml.j2', 'output': '.github/workflows/ci.yml'}
             }
         """
-        return {}
+        return self.PLATFORM_TEMPLATE_MAP
 
     def render_template(self, template_name: str, context: Dict[str, Any]) -> str:
         """
@@ -73,58 +281,237 @@ class BaseGenerator:
             Rendered template content as string
         """
         try:
-            template = self.jinja_env.get_template(template_name)
-            return template.render(context)
+            renderer = self._renderers.get(template_name)
+            if renderer is not None:
+                return renderer(context)
+            return self._get_template(template_name).render(context)
         except Exception as e:
             raise Exception(f"Failed to render template {template_name}: {e}")
 
+    def _get_template(self, template_name: str) -> Template:
+        """Return a preloaded template, loading it through Jinja2 once if needed"""
+        template = self._templates.get(template_name)
+        if template is None:
+            # Shared with every generator of this framework, like the preloaded ones
+            template = self._templates[template_name] = self.jinja_env.get_template(template_name)
+        return template
+
     # ============ Shared File Writing ============
 
-    def write_file(self, content: str, output_path: Path, verbose: bool = True) -> Path:
+    def write_file(
+            self,
+            content: str,
+            output_path: Path,
+            verbose: bool = True,
+            logs: Optional[List[str]] = None
+    ) -> Path:
         """
         Write content to file
 
         Args:
             content: String content to write
             output_path: Path where to write file
-            verbose: Print success message
+            verbose: Report success message
+            logs: Collect the message here instead of printing it
 
         Returns:
             Path to written file
         """
         try:
-            output_path = Path(output_path)
+            output_path = self._as_path(output_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(content)
+            self._write_bytes(output_path, content.encode('utf-8'))
 
             if verbose:
-                print(f"    Generated: {output_path.name}")
+                self._report(f"    Generated: {output_path.name}", logs)
 
             return output_path
         except Exception as e:
             raise Exception(f"Failed to write file {output_path}: {e}")
 
+    def _flush_logs(self, logs: List[str]) -> None:
+        """Write collected progress messages to stdout in one call (nothing when not verbose)"""
+        if self.verbose and logs:
+            sys.stdout.write('\n'.join(logs) + '\n')
+
+    @staticmethod
+    def _report(message: str, logs: Optional[List[str]]) -> None:
+        """Print a progress message, or append it to logs for one flush later"""
+        if logs is None:
+            print(message)
+        else:
+            logs.append(message)
+
+    def _write_bytes(self, output_path: Path, data: bytes) -> None:
+        """Write pre-encoded data with raw os.write (no Python buffering), replacing the file atomically"""
+        with _replacing(output_path) as fd:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+
     def generate_file_from_template(
             self,
             template_name: str,
             context: Dict[str, Any],
             output_path: Path,
-            verbose: bool = True
+            verbose: bool = True,
+            logs: Optional[List[str]] = None,
+            make_dirs: bool = True
     ) -> Path:
         """
         Convenience method: render template and write to file
 
+        Small templates are rendered and written in one os.write; large ones
+        are streamed straight into the file so the full output is never held
+        in memory as one string. Either way the output goes to a temp file
+        that replaces output_path only once complete, so a failed render
+        never truncates or deletes an existing file.
+
         Args:
             template_name: Template file name
             context: Template variables
             output_path: Where to write
-            verbose: Print messages
+            verbose: Report messages
+            logs: Collect messages here instead of printing them
+            make_dirs: Create missing parent directories (callers that
+                already created them skip the mkdir syscalls)
 
         Returns:
             Path to generated file
         """
-        content = self.render_template(template_name, context)
-        return self.write_file(content, output_path, verbose)
+        renderer = self._renderers.get(template_name)
+        if renderer is None:
+            try:
+                template = self._get_template(template_name)
+            except Exception as e:
+                raise Exception(f"Failed to render template {template_name}: {e}")
+
+        output_path = self._as_path(output_path)
+        try:
+            if make_dirs:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+            if renderer is not None:
+                self._write_bytes(output_path, renderer(context).encode('utf-8'))
+            elif self._template_sizes.get(template_name, 0) < _STREAM_THRESHOLD:
+                self._write_bytes(output_path, template.render(context).encode('utf-8'))
+            else:
+                # Binary like _write_bytes: no text layer, no newline translation
+                with _replacing(output_path) as fd, open(fd, 'wb', closefd=False) as f:
+                    stream = template.stream(context)
+                    stream.enable_buffering(_STREAM_BUFFER_SIZE)
+                    stream.dump(f, encoding='utf-8')
+        except Exception as e:
+            # Output is only ever renamed into place once complete, so a failed
+            # render leaves any existing file untouched
+            raise Exception(f"Failed to render template {template_name} to {output_path}: {e}")
+
+        if verbose:
+            self._report(f"    Generated: {output_path.name}", logs)
+
+        return output_path
+
+    def generate_platform_files(
+            self,
+            platforms: List[str],
+            context: Dict[str, Any],
+            output_path: Path,
+            logs: Optional[List[str]] = None
+    ) -> Dict[str, str]:
+        """
+        Render and write the CI/CD file of each requested platform
+
+        Platforms are independent, so they are generated concurrently on a
+        thread pool (the shared Jinja2 environment is safe for that with
+        auto_reload off). Messages are reported in platform order once all
+        files are written; a failed platform is reported and skipped.
+
+        Args:
+            platforms: Platform names from get_platform_template_map()
+            context: Template variables
+            output_path: Output directory
+            logs: Collect messages here instead of printing them
+
+        Returns:
+            Dict of platform -> generated file path
+        """
+        template_map = self.get_platform_template_map()
+        platforms = list(dict.fromkeys(platforms))  # Never write one file from two threads
+
+        # Generation plan: platform -> output file (None for unknown platforms)
+        plan = {
+            platform: output_path / template_map[platform]['output'] if platform in template_map else None
+            for platform in platforms
+        }
+
+        # Create each output dir once, up front, so writers never repeat the
+        # mkdir or race on shared parents like .github/workflows
+        ready_dirs = set()
+        for parent in {path.parent for path in plan.values() if path is not None}:
+            try:
+                parent.mkdir(parents=True, exist_ok=True)
+                ready_dirs.add(parent)
+            except OSError:
+                pass  # Retried and reported by the platform's own write
+
+        def generate_one(platform: str) -> Tuple[Optional[str], List[str]]:
+            messages: List[str] = []
+            platform_output = plan[platform]
+            if platform_output is None:
+                messages.append(f"   ⚠️  Skipping unknown platform: {platform}")
+                return None, messages
+
+            try:
+                self.generate_file_from_template(
+                    template_map[platform]['template'], context, platform_output,
+                    logs=messages, make_dirs=platform_output.parent not in ready_dirs
+                )
+                return str(platform_output), messages
+            except Exception as e:
+                messages.append(f"   ❌ Failed to generate {platform}: {e}")
+                return None, messages
+
+        if len(platforms) > 1:
+            with ThreadPoolExecutor(max_workers=min(_MAX_PLATFORM_WORKERS, len(platforms))) as executor:
+                results = list(executor.map(generate_one, platforms))
+        else:
+            results = [generate_one(platform) for platform in platforms]
+
+        generated_files = {}
+        for platform, (file_path, messages) in zip(platforms, results):
+            if file_path is not None:
+                generated_files[platform] = file_path
+            for message in messages:
+                self._report(message, logs)
+        return generated_files
+
+    def generate_dockerfile(
+            self,
+            context: Dict[str, Any],
+            output_path: Path,
+            generated_files: Dict[str, str],
+            logs: Optional[List[str]] = None
+    ) -> None:
+        """
+        Render Dockerfile.j2 next to the CI/CD files
+
+        Skipped when the 'docker' platform already wrote the same Dockerfile.
+
+        Args:
+            context: Template variables
+            output_path: Output directory
+            generated_files: Platform -> path map, updated with 'dockerfile'
+            logs: Collect messages here instead of printing them
+        """
+        dockerfile_path = output_path / 'Dockerfile'
+        if generated_files.get('docker') == str(dockerfile_path):
+            generated_files['dockerfile'] = generated_files['docker']
+            return
+
+        try:
+            self.generate_file_from_template('Dockerfile.j2', context, dockerfile_path, logs=logs)
+            generated_files['dockerfile'] = str(dockerfile_path)
+        except Exception as e:
+            self._report(f"   ⚠️  Skipping Dockerfile: {e}", logs)
 
     # ============ Shared Context Building ============
 
@@ -143,14 +530,19 @@ class BaseGenerator:
 
         return {
             'project_name': project_name,
-            'generation_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'generation_date': _RUN_TIMESTAMP,
             'language': detection_result.get('language'),
             'framework': detection_result.get('framework'),
         }
 
     # ============ Shared File Structure Detection ============
 
-    def detect_app_module(self, project_path: Path, exclude_dirs: list = None) -> str:
+    def detect_app_module(
+            self,
+            project_path: Path,
+            exclude_dirs: list = None,
+            dir_names: Optional[List[str]] = None
+    ) -> str:
         """
         Detect the main application module name
         Common patterns: app/, src/, project_name/
@@ -158,6 +550,8 @@ class BaseGenerator:
         Args:
             project_path: Project directory
             exclude_dirs: Directories to skip (defaults to common test/docs dirs)
+            dir_names: Top-level directory names in directory order, if the
+                caller already scanned the project (saves a second scandir)
 
         Returns:
             Main module name
@@ -165,23 +559,53 @@ class BaseGenerator:
         if exclude_dirs is None:
             exclude_dirs = ['tests', 'test', 'docs', 'scripts', 'venv', '.venv', 'templates', 'node_modules']
 
+        candidates = ('app', 'src', 'cli', project_path.name)
+        root = str(project_path)
+        if dir_names is None:
+            dir_names = self._scan_dir_names(root)
+        dir_set = frozenset(dir_names)
+
         # Check common directories first
-        for candidate in ['app', 'src', 'cli', project_path.name]:
-            candidate_path = project_path / candidate
-            if candidate_path.is_dir() and self._is_valid_module(candidate_path):
+        for candidate in candidates:
+            if candidate in dir_set and self._is_module_dir(root, candidate):
                 return candidate
 
-        # Find any directory with module indicators
-        try:
-            for item in project_path.iterdir():
-                if item.is_dir() and item.name not in exclude_dirs:
-                    if self._is_valid_module(item):
-                        return item.name
-        except Exception:
-            pass
+        # Fall back to the first module found (directory order); candidates were checked above
+        for name in dir_names:
+            if name not in exclude_dirs and name not in candidates \
+                    and self._is_module_dir(root, name):
+                return name
 
         return 'app'  # Default fallback
 
+    def _scan_dir_names(self, root: str) -> List[str]:
+        """
+        Names of the top-level directories of a project, from one scandir pass
+
+        Args:
+            root: Project directory
+
+        Returns:
+            Directory names in directory order
+        """
+        try:
+            with os.scandir(root) as entries:
+                return [entry.name for entry in entries if entry.is_dir()]
+        except OSError:
+            return []
+
+    def _is_module_dir(self, root: str, name: str) -> bool:
+        """
+        Whether root/name is a valid module, per _is_valid_module
+
+        The default check runs on plain strings with os.path; an overridden
+        _is_valid_module is called with a Path, as its signature promises.
+        """
+        path = os.path.join(root, name)
+        if type(self)._is_valid_module is BaseGenerator._is_valid_module:
+            return os.path.exists(os.path.join(path, '__init__.py'))
+        return self._is_valid_module(Path(path))
+
     def _is_valid_module(self, path: Path) -> bool:
         """
         Check if directory is a valid module
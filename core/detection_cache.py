@@ -0,0 +1,166 @@
+"""
+Detection Cache
+Persists detection results on disk so repeated runs on an unchanged project
+skip the detectors entirely
+"""
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional, Dict, List, Tuple
+
+from .project_snapshot import ProjectSnapshot
+
+# Entries older than this are ignored even if the project looks unchanged
+CACHE_TTL = 3600
+
+# Per-user cache root, also home to the Jinja2 bytecode cache
+CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'cicd-framework'
+
+# Nested files the detectors look at below the top level: .csproj files are
+# read, the others only need to exist (.sln, .py and .java probes)
+_NESTED_READ_SUFFIXES = ('.csproj',)
+_NESTED_PROBE_SUFFIXES = ('.sln', '.py', '.java')
+
+
+def _cache_file(project_path: Path) -> Path:
+    """Cache file for a project, named after a hash of its path"""
+    return CACHE_DIR / f"{hashlib.sha256(str(project_path).encode()).hexdigest()}.json"
+
+
+def fingerprint(project_path: Path, snapshot: Optional[ProjectSnapshot] = None) -> Optional[str]:
+    """
+    Hash of every project file the detectors depend on
+
+    Covers (name, mtime_ns, size) of every top-level file - the manifests
+    (pyproject.toml, requirements*.txt, package.json, pom.xml, build.gradle*,
+    lock files, ...) - plus the project directory's own mtime, so adding or
+    removing top-level entries invalidates the cache. Below the top level the
+    snapshot's walk is reused (the same one the detectors use): nested .csproj
+    files are hashed with their stats, and the paths of nested .sln, .py and
+    .java files are hashed so adding or removing one invalidates the cache too.
+
+    Args:
+        project_path: Resolved project directory
+        snapshot: The ProjectSnapshot detection will use, so the tree is walked
+            once for both (a new one is built if not given)
+
+    Returns:
+        Hex digest, or None if the project directory cannot be read
+    """
+    root = str(project_path)
+    try:
+        parts = [('.', os.stat(root).st_mtime_ns, 0)]
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    stat = entry.stat()
+                    parts.append((entry.name, stat.st_mtime_ns, stat.st_size))
+    except OSError:
+        return None
+
+    if snapshot is None:
+        snapshot = ProjectSnapshot(project_path)
+    files_by_extension = snapshot.files_by_extension
+    prefix = len(root) + 1
+
+    for suffix in _NESTED_READ_SUFFIXES:
+        for path in files_by_extension.get(suffix, ()):
+            relative = path[prefix:]
+            if os.sep in relative:
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                parts.append((relative, stat.st_mtime_ns, stat.st_size))
+    # Probed files can be many (every nested .py / .java): hashed as one joined
+    # string of relative paths rather than a tuple each
+    probed = [
+        path[prefix:]
+        for suffix in _NESTED_PROBE_SUFFIXES
+        for path in files_by_extension.get(suffix, ())
+    ]
+    probed.sort()
+
+    digest = hashlib.sha256(repr(sorted(parts)).encode())
+    digest.update(b'\0')
+    digest.update('\n'.join(probed).encode(errors='surrogateescape'))
+    return digest.hexdigest()
+
+
+def load(
+        project_path: Path,
+        frameworks: List[str],
+        current: Optional[str] = None
+) -> Optional[Tuple[str, Dict]]:
+    """
+    Return the cached detection for a project, if still valid
+
+    Args:
+        project_path: Resolved project directory
+        frameworks: Frameworks the caller would try, in order
+        current: The project's fingerprint(), if the caller already computed it
+
+    Returns:
+        (framework name, detection result), or None on a miss
+    """
+    if current is None:
+        current = fingerprint(project_path)
+    if current is None:
+        return None
+
+    try:
+        with open(_cache_file(project_path), 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+        if (
+                entry['fingerprint'] != current
+                or entry['frameworks'] != frameworks
+                or time.time() - entry['timestamp'] >= CACHE_TTL
+        ):
+            return None
+        return entry['framework'], entry['result']
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save(
+        project_path: Path,
+        frameworks: List[str],
+        framework: str,
+        result: Dict,
+        current: Optional[str] = None
+) -> None:
+    """
+    Store a detection result for a project (best effort, errors are ignored)
+
+    The entry is written to a temp file and moved into place with os.replace,
+    so concurrent runs never see a partial file. Pass the fingerprint taken
+    before detection ran: a file changed during detection then forces a
+    fresh run next time instead of being masked.
+    """
+    if current is None:
+        current = fingerprint(project_path)
+    if current is None:
+        return
+
+    entry = {
+        'fingerprint': current,
+        'frameworks': frameworks,
+        'timestamp': time.time(),
+        'framework': framework,
+        'result': result,
+    }
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, _cache_file(project_path))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except (OSError, TypeError, ValueError):
+        pass
@@ -0,0 +1,81 @@
+"""
+Project Snapshot
+Filesystem facts about one project, gathered once and shared by every detector
+"""
+import os
+from functools import cached_property
+from pathlib import Path
+from typing import Optional, Dict, FrozenSet, List
+
+from .base_detector import EXCLUDED_DIRS, read_text
+
+
+class ProjectSnapshot:
+    """
+    One-shot view of a project tree for running several detectors
+
+    Top-level entries come from a single scandir, the source tree is walked
+    at most once (pruning EXCLUDED_DIRS), and each file is read at most once,
+    however many detectors ask for it. Detectors may run in threads: every
+    piece is computed lazily and a rare duplicate computation is harmless.
+    """
+
+    def __init__(self, project_path: Path):
+        """
+        Args:
+            project_path: Path to the project to snapshot
+        """
+        self.project_path = Path(project_path)
+        # filename -> content (None when missing or unreadable)
+        self._files: Dict[str, Optional[str]] = {}
+
+    @cached_property
+    def entries(self) -> FrozenSet[str]:
+        """Names of all top-level project entries"""
+        try:
+            with os.scandir(self.project_path) as entries:
+                return frozenset(entry.name for entry in entries)
+        except OSError:
+            return frozenset()
+
+    @cached_property
+    def files_by_extension(self) -> Dict[str, List[str]]:
+        """Paths of all project files grouped by lowercase extension (e.g. '.py'), from one walk"""
+        files: Dict[str, List[str]] = {}
+        stack = [str(self.project_path)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in EXCLUDED_DIRS:
+                                stack.append(entry.path)
+                        else:
+                            files.setdefault(os.path.splitext(entry.name)[1].lower(), []).append(entry.path)
+            except OSError:
+                continue
+        return files
+
+    def files_with_extension(self, suffix: str) -> List[str]:
+        """Paths of project files ending in suffix (e.g. '.py', case-insensitive)"""
+        return self.files_by_extension.get(suffix.lower(), [])
+
+    def read(self, filename: str) -> Optional[str]:
+        """
+        Read a project file once per snapshot
+
+        Returns:
+            File content, or None if the file is missing or unreadable
+        """
+        try:
+            return self._files[filename]
+        except KeyError:
+            pass
+
+        # Top-level names are answered by the scandir set; nested paths skip the
+        # exists() stat since a failed open already means the file is missing
+        if '/' in filename or filename in self.entries:
+            content = read_text(str(self.project_path), filename)
+        else:
+            content = None
+        return self._files.setdefault(filename, content)
@@ -1,39 +1,70 @@
 """
 Frameworks module - Registry of all framework detectors and generators
+
+Frameworks live in a fixed, index-addressed table: FRAMEWORK_NAMES gives the
+detection order and each name maps to one index into the spec and class
+tables. Specs are 'package.module:Class' strings so that importing the
+registry does not import every framework; load_detector()/load_generator()
+resolve a class on first use and keep it.
 """
-from .python import PythonDetector, PythonGenerator
-from .node import NodeDetector, NodeGenerator
-from .maven import MavenDetector, MavenGenerator
-from .gradle import GradleDetector, GradleGenerator
-from .java import JavaDetector, JavaGenerator
-from .dotnet import DotNetDetector, DotNetGenerator
+import importlib
+from typing import Dict, List, Optional
 
 # Order matters! Specific frameworks before generic
-AVAILABLE_FRAMEWORKS = {
-    'python': {
-        'detector': PythonDetector,
-        'generator': PythonGenerator
-    },
-    'node': {
-        'detector': NodeDetector,
-        'generator': NodeGenerator
-    },
-    'maven': {
-        'detector': MavenDetector,
-        'generator': MavenGenerator
-    },
-    'gradle': {
-        'detector': GradleDetector,
-        'generator': GradleGenerator
-    },
-    'java': {
-        'detector': JavaDetector,
-        'generator': JavaGenerator
-    },
-    'dotnet': {
-        'detector': DotNetDetector,
-        'generator': DotNetGenerator
-    }
+FRAMEWORK_NAMES = ('python', 'node', 'maven', 'gradle', 'java', 'dotnet')
+
+_FRAMEWORK_INDEX = {name: index for index, name in enumerate(FRAMEWORK_NAMES)}
+
+# (detector spec, generator spec), indexed like FRAMEWORK_NAMES
+_SPECS = (
+    ('frameworks.python.detector:PythonDetector', 'frameworks.python.generator:PythonGenerator'),
+    ('frameworks.node.detector:NodeDetector', 'frameworks.node.generator:NodeGenerator'),
+    ('frameworks.maven.detector:MavenDetector', 'frameworks.maven.generator:MavenGenerator'),
+    ('frameworks.gradle.detector:GradleDetector', 'frameworks.gradle.generator:GradleGenerator'),
+    ('frameworks.java.detector:JavaDetector', 'frameworks.java.generator:JavaGenerator'),
+    ('frameworks.dotnet.detector:DotNetDetector', 'frameworks.dotnet.generator:DotNetGenerator'),
+)
+
+_DETECTOR, _GENERATOR = 0, 1
+
+# Resolved (detector, generator) classes, filled on first use
+_CLASSES: List[List[Optional[type]]] = [[None, None] for _ in FRAMEWORK_NAMES]
+
+# Name -> {'detector': spec, 'generator': spec} view of the table
+AVAILABLE_FRAMEWORKS: Dict[str, Dict[str, str]] = {
+    name: {'detector': detector, 'generator': generator}
+    for name, (detector, generator) in zip(FRAMEWORK_NAMES, _SPECS)
 }
 
-__all__ = ['AVAILABLE_FRAMEWORKS']
\ No newline at end of file
+
+def load_class(spec: str) -> type:
+    """
+    Import and return the class named by a registry spec
+
+    Args:
+        spec: 'package.module:Class' string from AVAILABLE_FRAMEWORKS
+    """
+    module_name, class_name = spec.split(':')
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _load(name: str, slot: int) -> type:
+    """Resolve and memoize the detector or generator class of a framework"""
+    index = _FRAMEWORK_INDEX[name]
+    cls = _CLASSES[index][slot]
+    if cls is None:
+        cls = _CLASSES[index][slot] = load_class(_SPECS[index][slot])
+    return cls
+
+
+def load_detector(name: str) -> type:
+    """Return the detector class of a registered framework"""
+    return _load(name, _DETECTOR)
+
+
+def load_generator(name: str) -> type:
+    """Return the generator class of a registered framework"""
+    return _load(name, _GENERATOR)
+
+
+__all__ = ['AVAILABLE_FRAMEWORKS', 'FRAMEWORK_NAMES', 'load_class', 'load_detector', 'load_generator']
@@ -0,0 +1,35 @@
+"""
+Default container ports shared by the framework generators
+
+One read-only table keyed by the framework names the detectors report.
+Each generator keeps its own fallback for frameworks not listed here.
+"""
+from types import MappingProxyType
+from typing import Mapping
+
+FRAMEWORK_PORTS: Mapping[str, int] = MappingProxyType({
+    # Python
+    'flask': 5000,
+    'django': 8000,
+    'fastapi': 8000,
+    'starlette': 8000,
+    'tornado': 8888,
+    'aiohttp': 8080,
+    'sanic': 8000,
+    'bottle': 8080,
+    # Node.js
+    'express': 3000,
+    'nestjs': 3000,
+    'nextjs': 3000,
+    'fastify': 3000,
+    'koa': 3000,
+    # Java (Maven / Gradle)
+    'spring-boot': 8080,
+    'quarkus': 8080,
+    'micronaut': 8080,
+    'jakarta-ee': 8080,
+    # .NET
+    'aspnetcore': 8080,
+    'blazor-server': 8080,
+    'blazor-wasm': 8080,
+})
@@ -0,0 +1,42 @@
+"""
+Manifest-based triage of framework detectors
+
+Looks only at the project's top-level names to rule out detectors that
+cannot match, so they are never run. It never reorders or adds frameworks:
+the registry order still decides between detectors that do match.
+"""
+from typing import AbstractSet, Dict, List, Tuple
+
+# Detectors that return None unless one of these top-level files exists
+REQUIRED_MANIFESTS: Dict[str, Tuple[str, ...]] = {
+    'node': ('package.json',),
+    'maven': ('pom.xml',),
+    'gradle': ('build.gradle', 'build.gradle.kts'),
+}
+
+# Detectors that step aside when one of these top-level files exists
+EXCLUDING_MANIFESTS: Dict[str, Tuple[str, ...]] = {
+    'java': ('pom.xml', 'build.gradle', 'build.gradle.kts'),
+}
+
+
+def triage(frameworks: List[str], top_names: AbstractSet[str]) -> List[str]:
+    """
+    Drop frameworks whose detector cannot match this project
+
+    Args:
+        frameworks: Framework names in registry order
+        top_names: Names of the project's top-level entries
+
+    Returns:
+        The frameworks still worth detecting, in the same order
+    """
+    candidates = []
+    for fw_name in frameworks:
+        required = REQUIRED_MANIFESTS.get(fw_name)
+        if required is not None and top_names.isdisjoint(required):
+            continue
+        if not top_names.isdisjoint(EXCLUDING_MANIFESTS.get(fw_name, ())):
+            continue
+        candidates.append(fw_name)
+    return candidates
@@ -1,7 +1,12 @@
 """
 .NET framework detector and generator
 """
-from .detector import DotNetDetector
-from .generator import DotNetGenerator
+from core._lazy import lazy_exports
 
-__all__ = ['DotNetDetector', 'DotNetGenerator']
\ No newline at end of file
+_EXPORTS = {
+    'DotNetDetector': '.detector',
+    'DotNetGenerator': '.generator',
+}
+__getattr__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
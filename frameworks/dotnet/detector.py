@@ -3,144 +3,123 @@
 Detects .NET Core/.NET 5+/Framework projects
 """
 import re
-import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Optional, Dict, List
 from core.base_detector import BaseDetector
 
+# Test framework markers in precedence order, as text and as raw bytes
+_TEST_FRAMEWORKS = ('xunit', 'nunit', 'mstest')
+_TEST_FRAMEWORK_BYTES = tuple(name.encode() for name in _TEST_FRAMEWORKS)
+
+# <TargetFramework> formats in one pattern: group 1 is net5.0+ (net8.0),
+# group 2 the older netcoreapp (netcoreapp3.1)
+_TFM_RE = re.compile(r'<TargetFramework>(?:net(\d+\.\d+)|netcoreapp(\d+\.\d+))</TargetFramework>')
+
 
 class DotNetDetector(BaseDetector):
     """Detector for .NET projects"""
 
+    __slots__ = ()
+
     def detect(self) -> Optional[Dict]:
         """Detect .NET project configuration"""
-        # Must have .csproj or .sln files
-        csproj_files = list(self.project_path.rglob('*.csproj'))
-        sln_files = list(self.project_path.rglob('*.sln'))
+        # Must have .csproj or .sln files (from the shared snapshot when there is one);
+        # only the presence of a solution matters, so that walk stops at the first
+        csproj_files = list(self.iter_files('*.csproj'))
+        has_solution = next(self.iter_files('*.sln'), None) is not None
 
-        if not csproj_files and not sln_files:
+        if not csproj_files and not has_solution:
             return None
 
-        # Analyze first .csproj file
+        # Analyze first .csproj file, read once for every check below
         project_file = csproj_files[0] if csproj_files else None
+        content = ''
+        if project_file is not None:
+            try:
+                # No exists() stat first: the file was just found by the walk
+                content = project_file.read_text()
+            except Exception:
+                pass
+        content_lower = content.lower()
 
         return {
             "language": "dotnet",
-            "framework": self._detect_framework(project_file),
-            "dotnet_version": self._detect_dotnet_version(project_file),
-            "project_type": self._detect_project_type(project_file),
-            "test_framework": self._detect_test_framework(),
-            "has_solution": bool(sln_files),
-            "is_web_app": self._is_web_app(project_file),
+            "framework": self._detect_framework(content_lower),
+            "dotnet_version": self._detect_dotnet_version(content),
+            "project_type": self._detect_project_type(content),
+            "test_framework": self._detect_test_framework(csproj_files, content_lower),
+            "has_solution": has_solution,
+            "is_web_app": self._is_web_app(content),
         }
 
-    def _detect_dotnet_version(self, project_file: Optional[Path]) -> str:
-        """Detect .NET version from .csproj"""
-        if not project_file or not project_file.exists():
-            return '8.0'
-
-        try:
-            content = project_file.read_text()
-
-            # Look for TargetFramework
-            match = re.search(r'<TargetFramework>net(\d+\.\d+)</TargetFramework>', content)
-            if match:
-                return match.group(1)
-
-            # Look for net8.0, net7.0 format
-            match = re.search(r'<TargetFramework>net(\d)\.(\d+)</TargetFramework>', content)
-            if match:
-                return f"{match.group(1)}.{match.group(2)}"
-
-            # Look for older format netcoreapp3.1
-            match = re.search(r'<TargetFramework>netcoreapp(\d+\.\d+)</TargetFramework>', content)
-            if match:
+    def _detect_dotnet_version(self, content: str) -> str:
+        """Detect .NET version from .csproj content"""
+        # One scan: a net5.0+ target wins wherever it is, netcoreapp is the fallback
+        netcoreapp = None
+        for match in _TFM_RE.finditer(content):
+            if match.group(1):
                 return match.group(1)
+            netcoreapp = netcoreapp or match.group(2)
 
-        except Exception:
-            pass
-
-        return '8.0'  # Default to .NET 8 (LTS)
+        return netcoreapp or '8.0'  # Default to .NET 8 (LTS)
 
-    def _detect_framework(self, project_file: Optional[Path]) -> Optional[str]:
-        """Detect ASP.NET Core, Blazor, etc."""
-        if not project_file or not project_file.exists():
-            return None
-
-        try:
-            content = project_file.read_text().lower()
-
-            if 'microsoft.aspnetcore.blazor' in content or 'microsoft.aspnetcore.components' in content:
-                if 'webassembly' in content:
+    def _detect_framework(self, content_lower: str) -> Optional[str]:
+        """Detect ASP.NET Core, Blazor, etc. from lowercased .csproj content"""
+        # The Blazor packages all start with microsoft.aspnetcore, so they are
+        # only searched for when that prefix is present at all
+        if 'microsoft.aspnetcore' in content_lower:
+            if 'microsoft.aspnetcore.blazor' in content_lower or 'microsoft.aspnetcore.components' in content_lower:
+                if 'webassembly' in content_lower:
                     return 'blazor-wasm'
                 else:
                     return 'blazor-server'
-            elif 'microsoft.aspnetcore' in content:
-                return 'aspnetcore'
-            elif 'microsoft.net.sdk.web' in content:
-                return 'aspnetcore'
-            elif 'microsoft.entityframeworkcore' in content:
-                return 'efcore'
-
-        except Exception:
-            pass
+            return 'aspnetcore'
+        elif 'microsoft.net.sdk.web' in content_lower:
+            return 'aspnetcore'
+        elif 'microsoft.entityframeworkcore' in content_lower:
+            return 'efcore'
 
         return None
 
-    def _detect_project_type(self, project_file: Optional[Path]) -> str:
-        """Detect project type (Web, Console, Library, etc.)"""
-        if not project_file or not project_file.exists():
+    def _detect_project_type(self, content: str) -> str:
+        """Detect project type (Web, Console, Library, etc.) from .csproj content"""
+        # Check SDK type
+        if 'Microsoft.NET.Sdk.Web' in content:
+            return 'web'
+        elif 'Microsoft.NET.Sdk.Worker' in content:
+            return 'worker'
+        elif '<OutputType>Exe</OutputType>' in content:
             return 'console'
-
-        try:
-            content = project_file.read_text()
-
-            # Check SDK type
-            if 'Microsoft.NET.Sdk.Web' in content:
-                return 'web'
-            elif 'Microsoft.NET.Sdk.Worker' in content:
-                return 'worker'
-            elif '<OutputType>Exe</OutputType>' in content:
-                return 'console'
-            elif '<OutputType>Library</OutputType>' in content:
-                return 'library'
-
-        except Exception:
-            pass
+        elif '<OutputType>Library</OutputType>' in content:
+            return 'library'
 
         return 'console'
 
-    def _detect_test_framework(self) -> str:
-        """Detect xUnit, NUnit, MSTest"""
-        csproj_files = list(self.project_path.rglob('*.csproj'))
-
-        for csproj in csproj_files:
-            try:
-                content = csproj.read_text().lower()
-
-                if 'xunit' in content:
-                    return 'xunit'
-                elif 'nunit' in content:
-                    return 'nunit'
-                elif 'mstest' in content:
-                    return 'mstest'
-
-            except Exception:
-                continue
+    def _detect_test_framework(self, csproj_files: List[Path], first_content_lower: Optional[str] = None) -> str:
+        """
+        Detect xUnit, NUnit, MSTest
+
+        Args:
+            csproj_files: .csproj paths found by detect(), in walk order
+            first_content_lower: Lowercased content of csproj_files[0], if already read
+        """
+        for index, csproj in enumerate(csproj_files):
+            if index == 0 and first_content_lower is not None:
+                haystack, needles = first_content_lower, _TEST_FRAMEWORKS
+            else:
+                try:
+                    # Lowercased as raw bytes, never decoded: the markers are ASCII
+                    haystack, needles = csproj.read_bytes().lower(), _TEST_FRAMEWORK_BYTES
+                except OSError:
+                    continue
+
+            for name, needle in zip(_TEST_FRAMEWORKS, needles):
+                if needle in haystack:
+                    return name
 
         return 'xunit'  # Default
 
-    def _is_web_app(self, project_file: Optional[Path]) -> bool:
-        """Check if this is a web application"""
-        if not project_file or not project_file.exists():
-            return False
-
-        try:
-            content = project_file.read_text()
-            return (
-                    'Microsoft.NET.Sdk.Web' in content or
-                    'Microsoft.AspNetCore' in content or
-                    '<Project Sdk="Microsoft.NET.Sdk.Web">' in content
-            )
-        except Exception:
-            return False
\ No newline at end of file
+    def _is_web_app(self, content: str) -> bool:
+        """Check if this is a web application from .csproj content"""
+        # Also covers <Project Sdk="Microsoft.NET.Sdk.Web">
+        return 'Microsoft.NET.Sdk.Web' in content or 'Microsoft.AspNetCore' in content
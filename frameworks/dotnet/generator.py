@@ -2,37 +2,48 @@
 .NET Project Generator
 Generates CI/CD files for .NET projects
 """
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional
 from core.base_generator import BaseGenerator
+from frameworks._ports import FRAMEWORK_PORTS
+
+
+# Runtime image per is_web_app: web apps need the ASP.NET Core runtime
+_RUNTIME_IMAGE = {
+    True: "mcr.microsoft.com/dotnet/aspnet:{}",
+    False: "mcr.microsoft.com/dotnet/runtime:{}",
+}
 
 
 class DotNetGenerator(BaseGenerator):
     """Generator for .NET projects"""
 
-    def __init__(self):
-        super().__init__('dotnet')
-
-    def get_platform_template_map(self) -> Dict[str, Dict[str, str]]:
-        """Get platform-specific template mapping for .NET"""
-        return {
-            'jenkins': {
-                'template': 'Jenkinsfile.j2',
-                'output': 'Jenkinsfile'
-            },
-            'gitlab': {
-                'template': 'gitlab-ci.yml.j2',
-                'output': '.gitlab-ci.yml'
-            },
-            'github': {
-                'template': 'github-actions.yml.j2',
-                'output': '.github/workflows/ci-cd.yml'
-            },
-            'docker': {
-                'template': 'Dockerfile.j2',
-                'output': 'Dockerfile'
-            }
+    __slots__ = ()
+
+    # Platform-specific template mapping for .NET
+    PLATFORM_TEMPLATE_MAP: Dict[str, Dict[str, str]] = {
+        'jenkins': {
+            'template': 'Jenkinsfile.j2',
+            'output': 'Jenkinsfile'
+        },
+        'gitlab': {
+            'template': 'gitlab-ci.yml.j2',
+            'output': '.gitlab-ci.yml'
+        },
+        'github': {
+            'template': 'github-actions.yml.j2',
+            'output': '.github/workflows/ci-cd.yml'
+        },
+        'docker': {
+            'template': 'Dockerfile.j2',
+            'output': 'Dockerfile'
         }
+    }
+
+    def __init__(self, verbose: bool = True):
+        super().__init__('dotnet', verbose)
 
     def generate(self, detection_result: Dict, output_dir: Path, platforms: List[str] = None) -> Dict:
         """
@@ -49,68 +60,35 @@ class DotNetGenerator(BaseGenerator):
         if platforms is None:
             platforms = ['jenkins']
 
-        output_path = Path(output_dir)
+        output_path = self._as_path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        project_path = Path(detection_result.get('project_path', output_dir))
+        project_path = self._as_path(detection_result.get('project_path', output_path))
         context = self._prepare_context(detection_result, project_path)
 
-        print(f"\n📦 Generating files for: {context['project_name']}")
-        print(f"   .NET: {context['dotnet_version']}")
-        print(f"   Project Type: {context['project_type']}")
-        print(f"   Framework: {context['framework'] or 'N/A'}")
-        print(f"   Web App: {context['is_web_app']}")
-        print(f"   Platforms: {', '.join(platforms)}")
-
-        template_map = self.get_platform_template_map()
-        generated_files = {}
+        # Generation info and per-file progress are printed in one go at the end
+        logs: List[str] = [
+            f"\n📦 Generating files for: {context['project_name']}",
+            f"   .NET: {context['dotnet_version']}",
+            f"   Project Type: {context['project_type']}",
+            f"   Framework: {context['framework'] or 'N/A'}",
+            f"   Web App: {context['is_web_app']}",
+            f"   Platforms: {', '.join(platforms)}",
+        ]
 
         # Generate CI/CD files for each requested platform
-        for platform in platforms:
-            if platform not in template_map:
-                print(f"   ⚠️  Skipping unknown platform: {platform}")
-                continue
-
-            config = template_map[platform]
-            platform_output = output_path / config['output']
-
-            try:
-                platform_output.parent.mkdir(parents=True, exist_ok=True)
-
-                self.generate_file_from_template(
-                    config['template'],
-                    context,
-                    platform_output,
-                    verbose=True
-                )
-                generated_files[platform] = str(platform_output)
-            except Exception as e:
-                print(f"   ❌ Failed to generate {platform}: {e}")
-
-        # Generate additional files
-        self._generate_additional_files(context, output_path, generated_files)
+        generated_files = self.generate_platform_files(platforms, context, output_path, logs)
+
+        # Generate the Dockerfile
+        self.generate_dockerfile(context, output_path, generated_files, logs)
+
+        self._flush_logs(logs)
 
         return {
             'context': context,
             'generated_files': generated_files
         }
 
-    def _generate_additional_files(self, context: Dict, output_path: Path, generated_files: Dict) -> None:
-        """Generate additional files like Dockerfile, docker-compose"""
-        try:
-            dockerfile_path = output_path / 'Dockerfile'
-            self.generate_file_from_template(
-                'Dockerfile.j2',
-                context,
-                dockerfile_path,
-                verbose=True
-            )
-            generated_files['dockerfile'] = str(dockerfile_path)
-        except Exception as e:
-            print(f"   ⚠️  Skipping Dockerfile: {e}")
-
-
-
     def _prepare_context(self, detection_result: Dict, project_path: Path) -> Dict[str, Any]:
         """Prepare .NET-specific template context"""
         context = self.add_base_context(detection_result, project_path)
@@ -125,9 +103,6 @@ class DotNetGenerator(BaseGenerator):
             'test_framework': detection_result.get('test_framework', 'xunit'),
             'has_solution': detection_result.get('has_solution', False),
             'is_web_app': is_web_app,
-            'docker_base_image': f"mcr.microsoft.com/dotnet/sdk:{dotnet_version}",
-            'docker_runtime_image': self._get_runtime_image(dotnet_version, is_web_app),
-            'docker_port': self._get_framework_port(detection_result.get('framework')),
 
             # Deployment configuration
             'deployment_type': detection_result.get('deployment_type', 'webapp'),
@@ -137,21 +112,26 @@ class DotNetGenerator(BaseGenerator):
                 'dotnet_version': [dotnet_version]
             }
         })
+        context.update(self._docker_context(dotnet_version, is_web_app, detection_result.get('framework')))
 
         return context
 
-    def _get_runtime_image(self, dotnet_version: str, is_web_app: bool) -> str:
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _docker_context(dotnet_version: str, is_web_app: bool, framework: Optional[str]) -> Mapping[str, Any]:
+        """Docker image and port variables, built once per (.NET version, web app, framework)"""
+        return MappingProxyType({
+            'docker_base_image': f"mcr.microsoft.com/dotnet/sdk:{dotnet_version}",
+            'docker_runtime_image': DotNetGenerator._get_runtime_image(dotnet_version, is_web_app),
+            'docker_port': DotNetGenerator._get_framework_port(framework),
+        })
+
+    @staticmethod
+    def _get_runtime_image(dotnet_version: str, is_web_app: bool) -> str:
         """Get appropriate runtime image"""
-        if is_web_app:
-            return f"mcr.microsoft.com/dotnet/aspnet:{dotnet_version}"
-        else:
-            return f"mcr.microsoft.com/dotnet/runtime:{dotnet_version}"
+        return _RUNTIME_IMAGE[bool(is_web_app)].format(dotnet_version)
 
-    def _get_framework_port(self, framework: str) -> int:
+    @staticmethod
+    def _get_framework_port(framework: str) -> int:
         """Get default port for .NET framework"""
-        ports = {
-            'aspnetcore': 8080,
-            'blazor-server': 8080,
-            'blazor-wasm': 8080,
-        }
-        return ports.get(framework, 8080)
+        return FRAMEWORK_PORTS.get(framework, 8080)
@@ -1,7 +1,12 @@
 """
 Gradle framework detector and generator
 """
-from .detector import GradleDetector
-from .generator import GradleGenerator
+from core._lazy import lazy_exports
 
-__all__ = ['GradleDetector', 'GradleGenerator']
\ No newline at end of file
+_EXPORTS = {
+    'GradleDetector': '.detector',
+    'GradleGenerator': '.generator',
+}
+__getattr__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
@@ -7,61 +7,64 @@ from pathlib import Path
 from typing import Optional, Dict
 from core.base_detector import BaseDetector
 
+# Java version declarations in one pattern, group number = precedence:
+# sourceCompatibility, then JavaVersion.VERSION_N, then the toolchain
+_JAVA_VERSION_RE = re.compile(
+    r'sourceCompatibility\s*=\s*["\']?(\d+)'
+    r'|JavaVersion\.VERSION_(\d+)'
+    r'|languageVersion\.set\(JavaLanguageVersion\.of\((\d+)\)\)'
+)
+
 
 class GradleDetector(BaseDetector):
     """Detector for Gradle projects"""
 
+    __slots__ = ()
+
     def detect(self) -> Optional[Dict]:
         """Detect Gradle project configuration"""
         # Must have build.gradle or build.gradle.kts
         if not (self.file_exists('build.gradle') or self.file_exists('build.gradle.kts')):
             return None
 
+        # Build script read once (build.gradle, else build.gradle.kts) for every check below
+        content = self.read_file('build.gradle') or self.read_file('build.gradle.kts')
+        content_lower = content.lower()
+
         return {
             "language": "java",
             "build_tool": "gradle",
-            "framework": self._detect_framework(),
-            "java_version": self._detect_java_version(),
-            "test_framework": self._detect_test_framework(),
+            "framework": self._detect_framework(content_lower),
+            "java_version": self._detect_java_version(content),
+            "test_framework": self._detect_test_framework(content_lower),
             "uses_kotlin_dsl": self.file_exists('build.gradle.kts'),
             "is_multi_project": self._is_multi_project(),
-        "packaging": self._detect_packaging(),  # ← ADD THIS
+        "packaging": self._detect_packaging(content),  # ← ADD THIS
 
         }
 
-    def _detect_java_version(self) -> str:
-        """Detect Java version from build.gradle"""
-        gradle_content = self.read_file('build.gradle')
-        if not gradle_content:
-            gradle_content = self.read_file('build.gradle.kts')
-
+    def _detect_java_version(self, gradle_content: str) -> str:
+        """Detect Java version from build script content"""
         if not gradle_content:
             return '17'
 
-        # Look for sourceCompatibility
-        version_match = re.search(r'sourceCompatibility\s*=\s*["\']?(\d+)', gradle_content)
-        if version_match:
-            return version_match.group(1)
-
-        # Look for JavaVersion
-        version_match = re.search(r'JavaVersion\.VERSION_(\d+)', gradle_content)
-        if version_match:
-            return version_match.group(1)
-
-        # Look for toolchain
-        version_match = re.search(r'languageVersion\.set\(JavaLanguageVersion\.of\((\d+)\)\)', gradle_content)
-        if version_match:
-            return version_match.group(1)
-
-        return '17'
-
-    def _detect_framework(self) -> Optional[str]:
-        """Detect Spring Boot, Quarkus, Micronaut, etc."""
-        gradle_content = self.read_file('build.gradle').lower()
-        if not gradle_content:
-            gradle_content = self.read_file('build.gradle.kts').lower()
-
-        if 'spring-boot' in gradle_content or 'org.springframework.boot' in gradle_content:
+        # One scan, keeping the first hit of the highest-precedence declaration
+        best_group, best_version = None, None
+        for version_match in _JAVA_VERSION_RE.finditer(gradle_content):
+            group = version_match.lastindex
+            if best_group is None or group < best_group:
+                best_group, best_version = group, version_match.group(group)
+                if group == 1:
+                    break
+
+        return best_version or '17'
+
+    def _detect_framework(self, gradle_content: str) -> Optional[str]:
+        """Detect Spring Boot, Quarkus, Micronaut, etc. from lowercased build script content"""
+        # Both Spring Boot markers contain 'spring', so one scan rules them out
+        if 'spring' in gradle_content and (
+                'spring-boot' in gradle_content or 'org.springframework.boot' in gradle_content
+        ):
             return 'spring-boot'
         elif 'quarkus' in gradle_content:
             return 'quarkus'
@@ -70,15 +73,12 @@ class GradleDetector(BaseDetector):
 
         return None
 
-    def _detect_test_framework(self) -> str:
-        """Detect JUnit, TestNG, Spock"""
-        gradle_content = self.read_file('build.gradle').lower()
-        if not gradle_content:
-            gradle_content = self.read_file('build.gradle.kts').lower()
-
-        if 'junit-jupiter' in gradle_content or "'junit5'" in gradle_content:
-            return 'junit5'
-        elif 'junit' in gradle_content:
+    def _detect_test_framework(self, gradle_content: str) -> str:
+        """Detect JUnit, TestNG, Spock from lowercased build script content"""
+        # Both JUnit 5 markers contain 'junit', so JUnit is settled by one scan when absent
+        if 'junit' in gradle_content:
+            if 'junit-jupiter' in gradle_content or "'junit5'" in gradle_content:
+                return 'junit5'
             return 'junit4'
         elif 'testng' in gradle_content:
             return 'testng'
@@ -91,22 +91,20 @@ class GradleDetector(BaseDetector):
         """Check if this is a multi-project Gradle build"""
         return self.file_exists('settings.gradle') or self.file_exists('settings.gradle.kts')
 
-    def _detect_packaging(self) -> str:
-        """Detect packaging type (jar, war)"""
-        gradle_content = self.read_file('build.gradle')
-        if not gradle_content:
-            gradle_content = self.read_file('build.gradle.kts')
-
+    def _detect_packaging(self, gradle_content: str) -> str:
+        """Detect packaging type (jar, war) from build script content"""
         if not gradle_content:
             return 'jar'
 
-        # Check for war plugin
-        if "id 'war'" in gradle_content or 'id("war")' in gradle_content:
-            return 'war'
+        # Every war plugin declaration contains 'war', so skip them all when it is absent
+        if 'war' in gradle_content:
+            # Check for war plugin
+            if "id 'war'" in gradle_content or 'id("war")' in gradle_content:
+                return 'war'
 
-        # Check for apply plugin
-        if "apply plugin: 'war'" in gradle_content or 'apply plugin: "war"' in gradle_content:
-            return 'war'
+            # Check for apply plugin
+            if "apply plugin: 'war'" in gradle_content or 'apply plugin: "war"' in gradle_content:
+                return 'war'
 
         # Check for bootWar task (Spring Boot)
         if 'bootWar' in gradle_content:
@@ -2,37 +2,41 @@
 Gradle Project Generator
 Generates Gradle-specific CI/CD files
 """
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional
 from core.base_generator import BaseGenerator
+from frameworks._ports import FRAMEWORK_PORTS
 
 
 class GradleGenerator(BaseGenerator):
     """Generator for Gradle projects"""
 
-    def __init__(self):
-        super().__init__('gradle')
-
-    def get_platform_template_map(self) -> Dict[str, Dict[str, str]]:
-        """Get platform-specific template mapping for Gradle"""
-        return {
-            'jenkins': {
-                'template': 'Jenkinsfile.j2',
-                'output': 'Jenkinsfile'
-            },
-            'gitlab': {
-                'template': 'gitlab-ci.yml.j2',
-                'output': '.gitlab-ci.yml'
-            },
-            'github': {
-                'template': 'github-actions.yml.j2',
-                'output': '.github/workflows/ci-cd.yml'
-            },
-            'docker': {
-                'template': 'Dockerfile.j2',
-                'output': 'Dockerfile'
-            }
+    __slots__ = ()
+
+    # Platform-specific template mapping for Gradle
+    PLATFORM_TEMPLATE_MAP: Dict[str, Dict[str, str]] = {
+        'jenkins': {
+            'template': 'Jenkinsfile.j2',
+            'output': 'Jenkinsfile'
+        },
+        'gitlab': {
+            'template': 'gitlab-ci.yml.j2',
+            'output': '.gitlab-ci.yml'
+        },
+        'github': {
+            'template': 'github-actions.yml.j2',
+            'output': '.github/workflows/ci-cd.yml'
+        },
+        'docker': {
+            'template': 'Dockerfile.j2',
+            'output': 'Dockerfile'
         }
+    }
+
+    def __init__(self, verbose: bool = True):
+        super().__init__('gradle', verbose)
 
     def generate(self, detection_result: Dict, output_dir: Path, platforms: List[str] = None) -> Dict:
         """
@@ -49,68 +53,35 @@ class GradleGenerator(BaseGenerator):
         if platforms is None:
             platforms = ['jenkins']
 
-        output_path = Path(output_dir)
+        output_path = self._as_path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        project_path = Path(detection_result.get('project_path', output_dir))
+        project_path = self._as_path(detection_result.get('project_path', output_path))
         context = self._prepare_context(detection_result, project_path)
 
-        print(f"\n📦 Generating files for: {context['project_name']}")
-        print(f"   Java: {context['java_version']}")
-        print(f"   Build Tool: Gradle")
-        print(f"   Framework: {context['framework'] or 'N/A'}")
-        print(f"   Kotlin DSL: {context['uses_kotlin_dsl']}")
-        print(f"   Platforms: {', '.join(platforms)}")
-
-        template_map = self.get_platform_template_map()
-        generated_files = {}
+        # Generation info and per-file progress are printed in one go at the end
+        logs: List[str] = [
+            f"\n📦 Generating files for: {context['project_name']}",
+            f"   Java: {context['java_version']}",
+            f"   Build Tool: Gradle",
+            f"   Framework: {context['framework'] or 'N/A'}",
+            f"   Kotlin DSL: {context['uses_kotlin_dsl']}",
+            f"   Platforms: {', '.join(platforms)}",
+        ]
 
         # Generate CI/CD files for each requested platform
-        for platform in platforms:
-            if platform not in template_map:
-                print(f"   ⚠️  Skipping unknown platform: {platform}")
-                continue
-
-            config = template_map[platform]
-            platform_output = output_path / config['output']
-
-            try:
-                platform_output.parent.mkdir(parents=True, exist_ok=True)
-
-                self.generate_file_from_template(
-                    config['template'],
-                    context,
-                    platform_output,
-                    verbose=True
-                )
-                generated_files[platform] = str(platform_output)
-            except Exception as e:
-                print(f"   ❌ Failed to generate {platform}: {e}")
-
-        # Generate additional files
-        self._generate_additional_files(context, output_path, generated_files)
+        generated_files = self.generate_platform_files(platforms, context, output_path, logs)
+
+        # Generate the Dockerfile
+        self.generate_dockerfile(context, output_path, generated_files, logs)
+
+        self._flush_logs(logs)
 
         return {
             'context': context,
             'generated_files': generated_files
         }
 
-    def _generate_additional_files(self, context: Dict, output_path: Path, generated_files: Dict) -> None:
-        """Generate additional files like Dockerfile, docker-compose"""
-        try:
-            dockerfile_path = output_path / 'Dockerfile'
-            self.generate_file_from_template(
-                'Dockerfile.j2',
-                context,
-                dockerfile_path,
-                verbose=True
-            )
-            generated_files['dockerfile'] = str(dockerfile_path)
-        except Exception as e:
-            print(f"   ⚠️  Skipping Dockerfile: {e}")
-
-
-
     def _prepare_context(self, detection_result: Dict, project_path: Path) -> Dict[str, Any]:
         """Prepare Gradle-specific template context"""
         context = self.add_base_context(detection_result, project_path)
@@ -124,10 +95,6 @@ class GradleGenerator(BaseGenerator):
             'uses_kotlin_dsl': detection_result.get('uses_kotlin_dsl', False),
             'is_multi_project': detection_result.get('is_multi_project', False),
             'packaging': detection_result.get('packaging', 'jar'),
-            'docker_base_image': f"eclipse-temurin:{java_version}-jdk-alpine",
-            'docker_runtime_image': f"eclipse-temurin:{java_version}-jre-alpine",
-            'docker_port': self._get_framework_port(detection_result.get('framework')),
-
             # Deployment configuration
             'deployment_type': detection_result.get('deployment_type', 'webapp'),
             'cloud_provider': detection_result.get('cloud_provider', 'local'),
@@ -136,14 +103,21 @@ class GradleGenerator(BaseGenerator):
                 'java_version': [java_version]
             }
         })
+        context.update(self._docker_context(java_version, detection_result.get('framework')))
 
         return context
 
-    def _get_framework_port(self, framework: str) -> int:
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _docker_context(java_version: str, framework: Optional[str]) -> Mapping[str, Any]:
+        """Docker image and port variables, built once per (Java version, framework)"""
+        return MappingProxyType({
+            'docker_base_image': f"eclipse-temurin:{java_version}-jdk-alpine",
+            'docker_runtime_image': f"eclipse-temurin:{java_version}-jre-alpine",
+            'docker_port': GradleGenerator._get_framework_port(framework),
+        })
+
+    @staticmethod
+    def _get_framework_port(framework: str) -> int:
         """Get default port for Java framework"""
-        ports = {
-            'spring-boot': 8080,
-            'quarkus': 8080,
-            'micronaut': 8080,
-        }
-        return ports.get(framework, 8080)
+        return FRAMEWORK_PORTS.get(framework, 8080)
@@ -1,7 +1,12 @@
 """
 Generic Java framework (fallback)
 """
-from .detector import JavaDetector
-from .generator import JavaGenerator
+from core._lazy import lazy_exports
 
-__all__ = ['JavaDetector', 'JavaGenerator']
\ No newline at end of file
+_EXPORTS = {
+    'JavaDetector': '.detector',
+    'JavaGenerator': '.generator',
+}
+__getattr__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
@@ -10,16 +10,19 @@ from core.base_detector import BaseDetector
 class JavaDetector(BaseDetector):
     """Generic detector for Java projects"""
 
+    __slots__ = ()
+
     def detect(self) -> Optional[Dict]:
         """Detect generic Java project"""
-        # Only detect if has .java files but no build tool
-        if not self.has_files_with_extension('java'):
-            return None
-
         # If Maven or Gradle files exist, let their detectors handle it
+        # (checked first: it needs no walk of the source tree)
         if self.file_exists('pom.xml') or self.file_exists('build.gradle') or self.file_exists('build.gradle.kts'):
             return None
 
+        # Only detect if has .java files but no build tool
+        if not self.has_files_with_extension('java'):
+            return None
+
         return {
             "language": "java",
             "build_tool": "none",
@@ -9,13 +9,15 @@ from core.base_generator import BaseGenerator
 class JavaGenerator(BaseGenerator):
     """Generic generator for Java projects"""
 
-    def __init__(self):
-        super().__init__('java')
+    __slots__ = ()
+
+    def __init__(self, verbose: bool = True):
+        super().__init__('java', verbose)
 
     def generate(self, detection_result: Dict, output_dir: Path) -> Dict:
         """Generate basic CI/CD files for Java project"""
-        output_path = Path(output_dir)
-        project_path = Path(detection_result.get('project_path', output_dir))
+        output_path = self._as_path(output_dir)
+        project_path = self._as_path(detection_result.get('project_path', output_path))
 
         context = self.add_base_context(detection_result, project_path)
         context.update({
@@ -23,7 +25,9 @@ class JavaGenerator(BaseGenerator):
             'docker_port': 8080
         })
 
-        print(f"\n⚠️  Generic Java project detected (no build tool)")
-        print(f"   Consider adding Maven (pom.xml) or Gradle (build.gradle)")
+        self._flush_logs([
+            "\n⚠️  Generic Java project detected (no build tool)",
+            "   Consider adding Maven (pom.xml) or Gradle (build.gradle)",
+        ])
 
         return {'context': context, 'generated_files': {}}
\ No newline at end of file
@@ -1,7 +1,12 @@
 """
 Maven framework detector and generator
 """
-from .detector import MavenDetector
-from .generator import MavenGenerator
+from core._lazy import lazy_exports
 
-__all__ = ['MavenDetector', 'MavenGenerator']
\ No newline at end of file
+_EXPORTS = {
+    'MavenDetector': '.detector',
+    'MavenGenerator': '.generator',
+}
+__getattr__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
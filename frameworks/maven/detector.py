@@ -8,50 +8,69 @@ from pathlib import Path
 from typing import Optional, Dict
 from core.base_detector import BaseDetector
 
+_POM_NS = '{http://maven.apache.org/POM/4.0.0}'
+
+# Java version properties, in precedence order, as namespaced tags
+_VERSION_PROPERTY_TAGS = tuple(
+    _POM_NS + prop for prop in ('maven.compiler.source', 'maven.compiler.target', 'java.version')
+)
+
+# Regex fallbacks for poms the XML lookup cannot read
+_COMPILER_SOURCE_RE = re.compile(r'<maven\.compiler\.source>(\d+)')
+_JAVA_VERSION_RE = re.compile(r'<java\.version>(\d+)')
+_PACKAGING_RE = re.compile(r'<packaging>(\w+)</packaging>')
+
 
 class MavenDetector(BaseDetector):
     """Detector for Maven projects"""
 
+    __slots__ = ()
+
     def detect(self) -> Optional[Dict]:
         """Detect Maven project configuration"""
         # Must have pom.xml
         if not self.file_exists('pom.xml'):
             return None
 
+        # pom.xml read once and lowercased once for every check below
+        pom_content = self.read_file('pom.xml')
+        pom_lower = pom_content.lower()
+
         return {
             "language": "java",
             "build_tool": "maven",
-            "framework": self._detect_framework(),
-            "java_version": self._detect_java_version(),
-            "test_framework": self._detect_test_framework(),
-            "is_multi_module": self._is_multi_module(),
-            "packaging": self._detect_packaging(),
+            "framework": self._detect_framework(pom_lower),
+            "java_version": self._detect_java_version(pom_content),
+            "test_framework": self._detect_test_framework(pom_lower),
+            "is_multi_module": self._is_multi_module(pom_content),
+            "packaging": self._detect_packaging(pom_content),
         }
 
-    def _detect_java_version(self) -> str:
-        """Detect Java version from pom.xml"""
-        pom_content = self.read_file('pom.xml')
+    def _detect_java_version(self, pom_content: str) -> str:
+        """Detect Java version from pom.xml content"""
         if not pom_content:
             return '17'
 
         try:
             root = ET.fromstring(pom_content)
-            ns = {'maven': 'http://maven.apache.org/POM/4.0.0'}
 
-            # Look for properties
-            properties = root.find('.//maven:properties', ns)
+            # Look for properties, collected in one pass over <properties>
+            properties = root.find(f'.//{_POM_NS}properties')
             if properties is not None:
-                for prop in ['maven.compiler.source', 'maven.compiler.target', 'java.version']:
-                    elem = properties.find(f'maven:{prop}', ns)
-                    if elem is not None and elem.text:
-                        return elem.text.strip()
+                found = {}
+                for elem in properties:
+                    if elem.tag in _VERSION_PROPERTY_TAGS and elem.tag not in found:
+                        found[elem.tag] = elem.text
+                for tag in _VERSION_PROPERTY_TAGS:
+                    if found.get(tag):
+                        return found[tag].strip()
 
             # Fallback to regex
-            version_match = re.search(r'<maven\.compiler\.source>(\d+)', pom_content)
+            version_match = _COMPILER_SOURCE_RE.search(pom_content)
             if version_match:
                 return version_match.group(1)
 
-            version_match = re.search(r'<java\.version>(\d+)', pom_content)
+            version_match = _JAVA_VERSION_RE.search(pom_content)
             if version_match:
                 return version_match.group(1)
 
@@ -60,10 +79,8 @@ class MavenDetector(BaseDetector):
 
         return '17'
 
-    def _detect_framework(self) -> Optional[str]:
-        """Detect Spring Boot, Quarkus, Micronaut, etc."""
-        pom_content = self.read_file('pom.xml').lower()
-
+    def _detect_framework(self, pom_content: str) -> Optional[str]:
+        """Detect Spring Boot, Quarkus, Micronaut, etc. from lowercased pom.xml content"""
         if 'spring-boot-starter' in pom_content:
             return 'spring-boot'
         elif 'quarkus' in pom_content:
@@ -75,29 +92,25 @@ class MavenDetector(BaseDetector):
 
         return None
 
-    def _detect_test_framework(self) -> str:
-        """Detect JUnit, TestNG"""
-        pom_content = self.read_file('pom.xml').lower()
-
-        if 'junit-jupiter' in pom_content or 'junit5' in pom_content:
-            return 'junit5'
-        elif 'junit' in pom_content:
+    def _detect_test_framework(self, pom_content: str) -> str:
+        """Detect JUnit, TestNG from lowercased pom.xml content"""
+        # Both JUnit 5 markers contain 'junit', so JUnit is settled by one scan when absent
+        if 'junit' in pom_content:
+            if 'junit-jupiter' in pom_content or 'junit5' in pom_content:
+                return 'junit5'
             return 'junit4'
         elif 'testng' in pom_content:
             return 'testng'
 
         return 'junit5'
 
-    def _is_multi_module(self) -> bool:
+    def _is_multi_module(self, pom_content: str) -> bool:
         """Check if this is a multi-module Maven project"""
-        pom_content = self.read_file('pom.xml')
         return '<modules>' in pom_content and '<module>' in pom_content
 
-    def _detect_packaging(self) -> str:
-        """Detect packaging type (jar, war, pom)"""
-        pom_content = self.read_file('pom.xml')
-
-        match = re.search(r'<packaging>(\w+)</packaging>', pom_content)
+    def _detect_packaging(self, pom_content: str) -> str:
+        """Detect packaging type (jar, war, pom) from pom.xml content"""
+        match = _PACKAGING_RE.search(pom_content)
         if match:
             return match.group(1)
 
@@ -1,3 +1,9 @@
-from  .detector import NodeDetector
-from .generator import NodeGenerator
-__all__ = ['NodeDetector', 'NodeGenerator']
\ No newline at end of file
+from core._lazy import lazy_exports
+
+_EXPORTS = {
+    'NodeDetector': '.detector',
+    'NodeGenerator': '.generator',
+}
+__getattr__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
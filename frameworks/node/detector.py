@@ -1,13 +1,34 @@
 # frameworks/node/detector.py
-import json
+import re
+from collections import ChainMap
+from itertools import takewhile
 from pathlib import Path
 from typing import Optional, Dict
 from core.base_detector import BaseDetector
+from core.project_snapshot import ProjectSnapshot
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # Optional speedup, falls back to stdlib json
+    from json import loads as _json_loads
+
+# Range operators that may precede the major version (">=18.0.0", "^20", "v18")
+_RANGE_PREFIX = '^~>=<v '
+
+# First number anywhere in an engines.node range, for shapes the prefix strip misses ("node 18")
+_MAJOR_RE = re.compile(r'(\d+)')
 
 
 class NodeDetector(BaseDetector):
     """Detector for Node.js projects"""
 
+    __slots__ = ('_package_json', '_dependencies')
+
+    def __init__(self, project_path: Path, snapshot: Optional[ProjectSnapshot] = None):
+        super().__init__(project_path, snapshot)
+        self._package_json: Optional[Dict] = None
+        self._dependencies: Optional[ChainMap] = None
+
     def detect(self) -> Optional[Dict]:
         """Detect Node.js project configuration"""
         if not self.file_exists('package.json'):
@@ -32,9 +53,12 @@ class NodeDetector(BaseDetector):
         pkg = self._read_package_json()
         if pkg and 'engines' in pkg and 'node' in pkg['engines']:
             version = pkg['engines']['node']
-            # Extract first number from ">=18.0.0" or "^20"
-            import re
-            match = re.search(r'(\d+)', version)
+            # Extract first number from ">=18.0.0" or "^20": strip the operator and
+            # take the leading digits, no regex needed for the common shapes
+            major = ''.join(takewhile(str.isdecimal, version.lstrip(_RANGE_PREFIX)))
+            if major:
+                return major
+            match = _MAJOR_RE.search(version)
             if match:
                 return match.group(1)
 
@@ -46,7 +70,7 @@ class NodeDetector(BaseDetector):
         if not pkg:
             return None
 
-        deps = self._get_all_dependencies(pkg)
+        deps = self._get_all_dependencies()
 
         if 'next' in deps:
             return 'nextjs'
@@ -77,7 +101,7 @@ class NodeDetector(BaseDetector):
         if not pkg:
             return 'jest'
 
-        deps = self._get_all_dependencies(pkg)
+        deps = self._get_all_dependencies()
 
         if 'jest' in deps:
             return 'jest'
@@ -88,23 +112,26 @@ class NodeDetector(BaseDetector):
 
         return 'jest'
 
-    def _read_package_json(self) -> Optional[Dict]:
-        """Read and parse package.json"""
-        content = self.read_file('package.json')
-        if not content:
-            return None
-
-        try:
-            return json.loads(content)
-        except json.JSONDecodeError:
-            return None
-
-    def _get_all_dependencies(self, pkg: Dict) -> set:
-        """Get all dependencies from package.json"""
-        deps = set()
-
-        for key in ['dependencies', 'devDependencies', 'peerDependencies']:
-            if key in pkg:
-                deps.update(pkg[key].keys())
-
-        return deps
\ No newline at end of file
+    def _read_package_json(self) -> Dict:
+        """Parse package.json once; empty dict if missing or invalid"""
+        if self._package_json is None:
+            content = self.read_file('package.json')
+            try:
+                self._package_json = _json_loads(content) if content else {}
+            except ValueError:  # json / orjson JSONDecodeError
+                self._package_json = {}
+        return self._package_json
+
+    def _get_all_dependencies(self) -> ChainMap:
+        """
+        Get all dependencies from package.json (built once)
+
+        A ChainMap view over the dependency sections answers membership
+        tests without copying every package name into a new set.
+        """
+        if self._dependencies is None:
+            pkg = self._read_package_json()
+            self._dependencies = ChainMap(*(
+                pkg.get(key) or {} for key in ('dependencies', 'devDependencies', 'peerDependencies')
+            ))
+        return self._dependencies
\ No newline at end of file
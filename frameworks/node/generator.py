@@ -2,34 +2,36 @@
 from pathlib import Path
 from typing import Dict, Any, List
 from core.base_generator import BaseGenerator
+from frameworks._ports import FRAMEWORK_PORTS
 
 
 class NodeGenerator(BaseGenerator):
     """Generator for Node.js projects"""
 
-    def __init__(self):
-        super().__init__('node')
-
-    def get_platform_template_map(self) -> Dict[str, Dict[str, str]]:
-        """Get platform-specific template mapping for Node.js"""
-        return {
-            'jenkins': {
-                'template': 'Jenkinsfile.j2',
-                'output': 'Jenkinsfile'
-            },
-            'gitlab': {
-                'template': 'gitlab-ci.yml.j2',
-                'output': '.gitlab-ci.yml'
-            },
-            'github': {
-                'template': 'github-actions.yml.j2',
-                'output': '.github/workflows/ci-cd.yml'
-            },
-            'docker': {
-                'template': 'Dockerfile.j2',
-                'output': 'Dockerfile'
-            }
+    __slots__ = ()
+
+    # Platform-specific template mapping for Node.js
+    PLATFORM_TEMPLATE_MAP: Dict[str, Dict[str, str]] = {
+        'jenkins': {
+            'template': 'Jenkinsfile.j2',
+            'output': 'Jenkinsfile'
+        },
+        'gitlab': {
+            'template': 'gitlab-ci.yml.j2',
+            'output': '.gitlab-ci.yml'
+        },
+        'github': {
+            'template': 'github-actions.yml.j2',
+            'output': '.github/workflows/ci-cd.yml'
+        },
+        'docker': {
+            'template': 'Dockerfile.j2',
+            'output': 'Dockerfile'
         }
+    }
+
+    def __init__(self, verbose: bool = True):
+        super().__init__('node', verbose)
 
     def generate(self, detection_result: Dict, output_dir: Path, platforms: List[str] = None) -> Dict:
         """
@@ -46,74 +48,37 @@ class NodeGenerator(BaseGenerator):
         if platforms is None:
             platforms = ['jenkins']
 
-        output_path = Path(output_dir)
+        output_path = self._as_path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
         # Get project path
-        project_path = Path(detection_result.get('project_path', output_dir))
+        project_path = self._as_path(detection_result.get('project_path', output_path))
 
         # Prepare template context
         context = self._prepare_context(detection_result, project_path)
 
-        # Print generation info
-        print(f"\n🔧 Generating files for: {context['project_name']}")
-        print(f"   Node: {context['node_version']}")
-        print(f"   Framework: {context['framework'] or 'N/A'}")
-        print(f"   Package Manager: {context['package_manager']}")
-        print(f"   Platforms: {', '.join(platforms)}")
-
-        # Get platform template map
-        template_map = self.get_platform_template_map()
-        generated_files = {}
+        # Generation info and per-file progress are printed in one go at the end
+        logs: List[str] = [
+            f"\n🔧 Generating files for: {context['project_name']}",
+            f"   Node: {context['node_version']}",
+            f"   Framework: {context['framework'] or 'N/A'}",
+            f"   Package Manager: {context['package_manager']}",
+            f"   Platforms: {', '.join(platforms)}",
+        ]
 
         # Generate CI/CD files for each requested platform
-        for platform in platforms:
-            if platform not in template_map:
-                print(f"   ⚠️  Skipping unknown platform: {platform}")
-                continue
-
-            config = template_map[platform]
-            platform_output = output_path / config['output']
-
-            try:
-                # Create parent directories if needed (for .github/workflows/)
-                platform_output.parent.mkdir(parents=True, exist_ok=True)
-
-                self.generate_file_from_template(
-                    config['template'],
-                    context,
-                    platform_output,
-                    verbose=True
-                )
-                generated_files[platform] = str(platform_output)
-            except Exception as e:
-                print(f"   ❌ Failed to generate {platform}: {e}")
-
-        # Generate additional files (Dockerfile, docker-compose, README)
-        self._generate_additional_files(context, output_path, generated_files)
+        generated_files = self.generate_platform_files(platforms, context, output_path, logs)
+
+        # Generate the Dockerfile
+        self.generate_dockerfile(context, output_path, generated_files, logs)
+
+        self._flush_logs(logs)
 
         return {
             'context': context,
             'generated_files': generated_files
         }
 
-    def _generate_additional_files(self, context: Dict, output_path: Path, generated_files: Dict) -> None:
-        """Generate additional files like Dockerfile, docker-compose, README"""
-        try:
-            # Generate Dockerfile
-            dockerfile_path = output_path / 'Dockerfile'
-            self.generate_file_from_template(
-                'Dockerfile.j2',
-                context,
-                dockerfile_path,
-                verbose=True
-            )
-            generated_files['dockerfile'] = str(dockerfile_path)
-        except Exception as e:
-            print(f"   ⚠️  Skipping Dockerfile: {e}")
-
-
-
     def _prepare_context(self, detection_result: Dict, project_path: Path) -> Dict[str, Any]:
         """Prepare template context"""
         context = self.add_base_context(detection_result, project_path)
@@ -137,13 +102,7 @@ class NodeGenerator(BaseGenerator):
 
         return context
 
-    def _get_framework_port(self, framework: str) -> int:
+    @staticmethod
+    def _get_framework_port(framework: str) -> int:
         """Get default port for Node framework"""
-        ports = {
-            'express': 3000,
-            'nestjs': 3000,
-            'nextjs': 3000,
-            'fastify': 3000,
-            'koa': 3000,
-        }
-        return ports.get(framework, 3000)
+        return FRAMEWORK_PORTS.get(framework, 3000)
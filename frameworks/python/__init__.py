@@ -1,5 +1,10 @@
 """Python framework"""
-from .detector import PythonDetector
-from .generator import PythonGenerator
+from core._lazy import lazy_exports
 
-__all__ = ['PythonDetector', 'PythonGenerator']
\ No newline at end of file
+_EXPORTS = {
+    'PythonDetector': '.detector',
+    'PythonGenerator': '.generator',
+}
+__getattr__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
@@ -3,14 +3,51 @@ Python Project Detector
 Inherits from BaseDetector and implements Python-specific detection logic
 """
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Set
+from typing import Optional, Dict, FrozenSet, Iterator
 from core.base_detector import BaseDetector
+from core.project_snapshot import ProjectSnapshot
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+
+# Version / dependency patterns, compiled once at import
+_RUNTIME_RE = re.compile(r'python-(\d+\.\d+(?:\.\d+)?)')
+_PY_SPEC_RE = re.compile(r'^[\^~>=\s]*(\d+\.\d+)')
+_SETUP_RE = re.compile(r'python_requires\s*=\s*["\'][>=~]*(\d+\.\d+)')
+_REQ_NAME_RE = re.compile(r'\s*([A-Za-z0-9][A-Za-z0-9._-]*)')
+
+# Web frameworks in detection priority order (first one found in the deps wins)
+_FRAMEWORK_PRIORITY = ('fastapi', 'flask', 'django', 'starlette', 'sanic', 'tornado', 'bottle')
+
+
+@lru_cache(maxsize=32)
+def parse_pyproject(content: str) -> Dict:
+    """
+    Parse pyproject.toml content; empty dict if invalid
+
+    Cached on the content so the detector and generator share one parse
+    per run. The returned dict is shared - treat it as read-only.
+    """
+    try:
+        return tomllib.loads(content)
+    except tomllib.TOMLDecodeError:
+        return {}
 
 
 class PythonDetector(BaseDetector):
     """Detector for Python projects"""
 
+    __slots__ = ('_deps', '_pyproject_data')
+
+    def __init__(self, project_path: Path, snapshot: Optional[ProjectSnapshot] = None):
+        super().__init__(project_path, snapshot)
+        self._deps: Optional[FrozenSet[str]] = None
+        self._pyproject_data: Optional[Dict] = None
+
     def detect(self) -> Optional[Dict]:
         """
         Detect Python project configuration
@@ -34,8 +71,8 @@ class PythonDetector(BaseDetector):
     # ============ Python-Specific Detection ============
 
     def _has_python_files(self) -> bool:
-        """Check if project has Python files"""
-        return self.has_files_with_extension('py')
+        """Check if project has Python files (stops at the first one found)"""
+        return next(self.iter_files('*.py'), None) is not None
 
     def _detect_package_manager(self) -> str:
         """Detect pip, poetry, or pipenv"""
@@ -52,8 +89,7 @@ class PythonDetector(BaseDetector):
             return 'pip'
 
         # Check pyproject.toml for poetry section
-        pyproject_content = self.read_file('pyproject.toml')
-        if '[tool.poetry]' in pyproject_content:
+        if self._read_pyproject().get('tool', {}).get('poetry') is not None:
             return 'poetry'
 
         return 'pip'  # Default fallback
@@ -61,39 +97,41 @@ class PythonDetector(BaseDetector):
     def _detect_python_version(self) -> str:
         """Detect Python version from various sources"""
         # 1. Check .python-version (pyenv standard)
-        if self.file_exists('.python-version'):
-            version = self.read_file('.python-version').strip()
-            return self.normalize_version(version)
+        version = self._read('.python-version')
+        if version is not None:
+            return self.normalize_version(version.strip())
 
         # 2. Check runtime.txt (Heroku standard)
         runtime_content = self.read_file('runtime.txt')
-        if runtime_content:
+        # Literal pre-checks skip the regex on files that cannot match
+        if 'python-' in runtime_content:
             # Format: python-3.11.2
             version = self.extract_version_from_content(
                 runtime_content,
-                r'python-(\d+\.\d+(?:\.\d+)?)'
+                _RUNTIME_RE
             )
             if version:
                 return version
 
         # 3. Check pyproject.toml
-        pyproject_content = self.read_file('pyproject.toml')
-        if pyproject_content:
-            # Look for: python = "^3.11"
-            version = self.extract_version_from_content(
-                pyproject_content,
-                r'python\s*=\s*["\'][\^~>=]*(\d+\.\d+)'
-            )
+        # Look for: requires-python = ">=3.11" or Poetry's python = "^3.11"
+        pyproject = self._read_pyproject()
+        python_spec = (
+            pyproject.get('project', {}).get('requires-python')
+            or pyproject.get('tool', {}).get('poetry', {}).get('dependencies', {}).get('python')
+        )
+        if isinstance(python_spec, str):
+            version = self.extract_version_from_content(python_spec, _PY_SPEC_RE)
             if version:
                 return version
 
         # 4. Check setup.py
         setup_content = self.read_file('setup.py')
-        if setup_content:
+        if 'python_requires' in setup_content:
             # Look for: python_requires='>=3.11'
             version = self.extract_version_from_content(
                 setup_content,
-                r'python_requires\s*=\s*["\'][>=~]*(\d+\.\d+)'
+                _SETUP_RE
             )
             if version:
                 return version
@@ -108,8 +146,7 @@ class PythonDetector(BaseDetector):
             return 'pytest'
 
         # 2. Check pyproject.toml for [tool.pytest]
-        pyproject_content = self.read_file('pyproject.toml')
-        if '[tool.pytest' in pyproject_content:
+        if 'pytest' in self._read_pyproject().get('tool', {}):
             return 'pytest'
 
         # 3. Check setup.cfg for [tool:pytest]
@@ -122,31 +159,24 @@ class PythonDetector(BaseDetector):
         if 'pytest' in deps:
             return 'pytest'
 
-        # 5. Check test files for imports
-        if self._has_pytest_imports():
-            return 'pytest'
-
-        # Default to pytest (most common)
+        # Default to pytest (most common). Scanning test files for pytest
+        # imports could only confirm the default, so the tree is not walked.
         return 'pytest'
 
     def _detect_framework(self) -> Optional[str]:
         """Detect Flask, Django, FastAPI, etc."""
         deps = self._read_all_dependencies()
 
-        # Check in priority order
-        if 'fastapi' in deps:
-            return 'fastapi'
-        elif 'flask' in deps:
-            return 'flask'
-        elif 'django' in deps:
-            return 'django'
-
-        return None  # Generic Python project
+        # Check in priority order; None means a generic Python project
+        return next((fw for fw in _FRAMEWORK_PRIORITY if fw in deps), None)
 
     # ============ Helper Methods ============
 
-    def _read_all_dependencies(self) -> Set[str]:
-        """Read dependencies from all common Python dependency files"""
+    def _read_all_dependencies(self) -> FrozenSet[str]:
+        """Read dependencies from all common Python dependency files (computed once)"""
+        if self._deps is not None:
+            return self._deps
+
         deps = set()
 
         # Check requirements.txt
@@ -156,30 +186,34 @@ class PythonDetector(BaseDetector):
         deps.update(self.parse_dependencies_from_file('requirements-dev.txt'))
 
         # Check pyproject.toml
-        pyproject_content = self.read_file('pyproject.toml')
-        if pyproject_content:
-            # Simple regex to find package names in dependencies list
-            matches = re.findall(r'["\']([a-z0-9\-_]+)["\']', pyproject_content.lower())
-            deps.update(matches)
-
-        return deps
-
-    def _has_pytest_imports(self) -> bool:
-        """Check if test files import pytest"""
-        test_dirs = ['tests', 'test']
-
-        for test_dir in test_dirs:
-            test_path = self.project_path / test_dir
-            if test_path.exists():
-                for test_file in test_path.rglob('test_*.py'):
-                    try:
-                        content = test_file.read_text()
-                        if 'import pytest' in content or 'from pytest' in content:
-                            return True
-                    except Exception:
-                        continue
-
-        return False
+        for requirement in self._iter_pyproject_requirements():
+            match = _REQ_NAME_RE.match(requirement)
+            if match:
+                deps.add(match.group(1).lower())
+
+        self._deps = frozenset(deps)
+        return self._deps
+
+    def _read_pyproject(self) -> Dict:
+        """Parse pyproject.toml once; empty dict if missing or invalid"""
+        if self._pyproject_data is None:
+            self._pyproject_data = parse_pyproject(self.read_file('pyproject.toml'))
+        return self._pyproject_data
+
+    def _iter_pyproject_requirements(self) -> Iterator[str]:
+        """Yield PEP 621 and Poetry dependency entries from pyproject.toml"""
+        data = self._read_pyproject()
+
+        project = data.get('project', {})
+        yield from project.get('dependencies', [])
+        for group in project.get('optional-dependencies', {}).values():
+            yield from group
+
+        poetry = data.get('tool', {}).get('poetry', {})
+        yield from poetry.get('dependencies', {})
+        yield from poetry.get('dev-dependencies', {})
+        for group in poetry.get('group', {}).values():
+            yield from group.get('dependencies', {})
 
 
 # Example usage
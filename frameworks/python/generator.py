@@ -2,34 +2,83 @@
 Python Project Generator
 Inherits from BaseGenerator and implements Python-specific generation logic
 """
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional
 from core.base_generator import BaseGenerator
+from frameworks._ports import FRAMEWORK_PORTS
+from .detector import parse_pyproject
+
+# Pipeline stages every generated Python pipeline enables
+_PIPELINE_CONFIG: Mapping[str, bool] = MappingProxyType({
+    'enable_linting': True,
+    'enable_security_scan': True,
+    'enable_docker': True,
+})
+
+
+def _pyproject_builds_package(pyproject_path: str) -> bool:
+    """
+    Whether a pyproject.toml declares a build system or Poetry config
+
+    Memoized per (path, mtime_ns, size), so a project examined more than once
+    in a process reads and checks an unchanged pyproject.toml only once,
+    while an edited one is checked again.
+    """
+    try:
+        stat = os.stat(pyproject_path)
+    except OSError:
+        return False
+    return _check_pyproject(pyproject_path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=256)
+def _check_pyproject(pyproject_path: str, mtime_ns: int, size: int) -> bool:
+    """Uncached body of _pyproject_builds_package; mtime_ns and size only key the cache"""
+    try:
+        with open(pyproject_path, 'rb') as f:
+            raw = f.read()
+    except OSError:
+        return False
+
+    # Both markers are ASCII: without either, skip the decode and TOML parse
+    if b'build-system' not in raw and b'poetry' not in raw:
+        return False
+    try:
+        content = raw.decode('utf-8')
+    except UnicodeDecodeError:
+        return False
+
+    data = parse_pyproject(content)
+    return 'build-system' in data or 'poetry' in data.get('tool', {})
 
 
 class PythonGenerator(BaseGenerator):
     """Generator for Python projects"""
 
-    def __init__(self):
-        """Initialize Python generator"""
-        super().__init__('python')
-
-    def get_platform_template_map(self) -> Dict[str, Dict]:
-        """Define templates for each platform"""
-        return {
-            'jenkins': {
-                'template': 'Jenkinsfile.j2',
-                'output': 'Jenkinsfile'
-            },
-            'gitlab': {
-                'template': 'gitlab-ci.yml.j2',
-                'output': '.gitlab-ci.yml'
-            },
-            'github': {
-                'template': 'github-actions.yml.j2',
-                'output': '.github/workflows/ci.yml'
-            }
+    __slots__ = ()
+
+    # Templates for each platform
+    PLATFORM_TEMPLATE_MAP: Dict[str, Dict[str, str]] = {
+        'jenkins': {
+            'template': 'Jenkinsfile.j2',
+            'output': 'Jenkinsfile'
+        },
+        'gitlab': {
+            'template': 'gitlab-ci.yml.j2',
+            'output': '.gitlab-ci.yml'
+        },
+        'github': {
+            'template': 'github-actions.yml.j2',
+            'output': '.github/workflows/ci.yml'
         }
+    }
+
+    def __init__(self, verbose: bool = True):
+        """Initialize Python generator"""
+        super().__init__('python', verbose)
 
     def generate(self, detection_result: Dict, output_dir: Path, platforms: List[str] = None) -> Dict:
         """
@@ -46,51 +95,31 @@ class PythonGenerator(BaseGenerator):
         if platforms is None:
             platforms = ['jenkins']
 
-        output_path = Path(output_dir)
+        output_path = self._as_path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
         # Get project path
-        project_path = Path(detection_result.get('project_path', output_dir))
+        project_path = self._as_path(detection_result.get('project_path', output_path))
 
         # Prepare template context
         context = self._prepare_context(detection_result, project_path)
 
-        # Print generation info
-        print(f"\n Generating files for: {context['project_name']}")
-        print(f"   Python: {context['python_version']}")
-        print(f"   Framework: {context['framework'] or 'N/A'}")
-        print(f"   Package Manager: {context['package_manager']}")
-        print(f"   Platforms: {', '.join(platforms)}")
-
-        # Get platform template map
-        template_map = self.get_platform_template_map()
-        generated_files = {}
+        # Generation info and per-file progress are printed in one go at the end
+        logs: List[str] = [
+            f"\n Generating files for: {context['project_name']}",
+            f"   Python: {context['python_version']}",
+            f"   Framework: {context['framework'] or 'N/A'}",
+            f"   Package Manager: {context['package_manager']}",
+            f"   Platforms: {', '.join(platforms)}",
+        ]
 
         # Generate CI/CD files for each requested platform
-        for platform in platforms:
-            if platform not in template_map:
-                print(f"    Skipping unknown platform: {platform}")
-                continue
-
-            config = template_map[platform]
-            platform_output = output_path / config['output']
-
-            try:
-                # Create parent directories if needed (for .github/workflows/)
-                platform_output.parent.mkdir(parents=True, exist_ok=True)
-
-                self.generate_file_from_template(
-                    config['template'],
-                    context,
-                    platform_output,
-                    verbose=True
-                )
-                generated_files[platform] = str(platform_output)
-            except Exception as e:
-                print(f"   ❌ Failed to generate {platform}: {e}")
+        generated_files = self.generate_platform_files(platforms, context, output_path, logs)
 
         # Generate additional files (Dockerfile, docker-compose, README)
-        self._generate_additional_files(context, output_path, generated_files)
+        self._generate_additional_files(context, output_path, generated_files, logs)
+
+        self._flush_logs(logs)
 
         return {
             'context': context,
@@ -99,38 +128,36 @@ class PythonGenerator(BaseGenerator):
 
     # ============ Additional Files Generation ============
 
-    def _generate_additional_files(self, context: Dict, output_path: Path, generated_files: Dict):
+    def _generate_additional_files(self, context: Dict, output_path: Path, generated_files: Dict,
+                                   logs: List[str]):
         """Generate Docker and README files if templates exist"""
 
         # 1. Generate Dockerfile
-        dockerfile_template = self.templates_dir / 'Dockerfile.j2'
-        if dockerfile_template.exists():
+        if 'Dockerfile.j2' in self._template_names:
             dockerfile_path = output_path / 'Dockerfile'
             try:
-                self.generate_file_from_template('Dockerfile.j2', context, dockerfile_path)
+                self.generate_file_from_template('Dockerfile.j2', context, dockerfile_path, logs=logs)
                 generated_files['dockerfile'] = str(dockerfile_path)
             except Exception as e:
-                print(f"   ⚠️  Could not generate Dockerfile: {e}")
+                logs.append(f"   ⚠️  Could not generate Dockerfile: {e}")
 
         # 2. Generate docker-compose.ymlf
-        compose_template = self.templates_dir / 'docker-compose.yml.j2'
-        if compose_template.exists():
+        if 'docker-compose.yml.j2' in self._template_names:
             compose_path = output_path / 'docker-compose.yml'
             try:
-                self.generate_file_from_template('docker-compose.yml.j2', context, compose_path)
+                self.generate_file_from_template('docker-compose.yml.j2', context, compose_path, logs=logs)
                 generated_files['docker_compose'] = str(compose_path)
             except Exception as e:
-                print(f"   ⚠️  Could not generate docker-compose.yml: {e}")
+                logs.append(f"   ⚠️  Could not generate docker-compose.yml: {e}")
 
         # 3. Generate README
-        readme_template = self.templates_dir / 'README.md.j2'
-        if readme_template.exists():
+        if 'README.md.j2' in self._template_names:
             readme_path = output_path / 'CICD_README.md'
             try:
-                self.generate_file_from_template('README.md.j2', context, readme_path)
+                self.generate_file_from_template('README.md.j2', context, readme_path, logs=logs)
                 generated_files['readme'] = str(readme_path)
             except Exception as e:
-                print(f"   ⚠️  Could not generate README: {e}")
+                logs.append(f"   ⚠️  Could not generate README: {e}")
 
     # ============ Python-Specific Context Preparation ============
 
@@ -139,94 +166,105 @@ class PythonGenerator(BaseGenerator):
 
         # Start with base context from parent
         context = self.add_base_context(detection_result, project_path)
+        python_version = detection_result.get('python_version', '3.11')
+
+        # One directory read answers every top-level file/dir check below
+        entries = self._scan_entries(project_path)
 
         # Add Python-specific fields
         context.update({
             # Python-specific info
-            'python_version': detection_result.get('python_version', '3.11'),
+            'python_version': python_version,
             'package_manager': detection_result.get('package_manager', 'pip'),
             'test_framework': detection_result.get('test_framework', 'pytest'),
 
             # Detected project structure
-            'app_module': self.detect_app_module(project_path),
-            'has_requirements_txt': (project_path / 'requirements.txt').exists(),
-            'has_requirements_dev': (project_path / 'requirements-dev.txt').exists(),
-            'has_tests': self._has_tests(project_path),
-            'build_package': self._is_library(project_path),
-
-            # Pipeline configuration
-            'enable_linting': True,
-            'enable_security_scan': True,
-            'enable_docker': True,
-
-            # Docker config
-            'docker_base_image': f"python:{detection_result.get('python_version', '3.11')}-slim",
-            'docker_port': self._get_framework_port(detection_result.get('framework')),
+            'app_module': self.detect_app_module(
+                project_path, dir_names=[name for name, is_dir in entries.items() if is_dir]
+            ),
+            'has_requirements_txt': 'requirements.txt' in entries,
+            'has_requirements_dev': 'requirements-dev.txt' in entries,
+            'has_tests': self._has_tests(entries),
+            'build_package': self._is_library(project_path, entries),
 
             # Deployment configuration
             'deployment_type': detection_result.get('deployment_type', 'webapp'),
             'cloud_provider': detection_result.get('cloud_provider', 'local'),
 
             # Additional context for templates
-            'has_pyproject_toml': (project_path / 'pyproject.toml').exists(),
-            'has_setup_py': (project_path / 'setup.py').exists(),
+            'has_pyproject_toml': 'pyproject.toml' in entries,
+            'has_setup_py': 'setup.py' in entries,
             'matrix': {
-                'python_version': [detection_result.get('python_version', '3.11')]
+                'python_version': [python_version]
             }
         })
+        # Pipeline configuration and Docker config
+        context.update(_PIPELINE_CONFIG)
+        context.update(self._docker_context(python_version, detection_result.get('framework')))
 
         return context
 
     # ============ Python-Specific Helper Methods ============
 
-    def _is_library(self, project_path: Path) -> bool:
+    @staticmethod
+    def _scan_entries(project_path: Path) -> Dict[str, bool]:
+        """
+        Top-level entries of the project in one os.scandir pass
+
+        Returns:
+            entry name -> whether it is a directory (symlinks followed, like
+            Path.is_dir); empty if the project dir cannot be read
+        """
+        entries: Dict[str, bool] = {}
+        try:
+            with os.scandir(project_path) as it:
+                for entry in it:
+                    try:
+                        entries[entry.name] = entry.is_dir()
+                    except OSError:
+                        entries[entry.name] = False
+        except OSError:
+            pass
+        return entries
+
+    def _is_library(self, project_path: Path, entries: Dict[str, bool]) -> bool:
         """
         Determine if this is a library (needs package building) or application
+
+        Args:
+            project_path: Project root
+            entries: Top-level entries from _scan_entries()
         """
         # Check for setup.py
-        if (project_path / 'setup.py').exists():
+        if 'setup.py' in entries:
             return True
 
-        # Check pyproject.toml for build system
-        pyproject = project_path / 'pyproject.toml'
-        if pyproject.exists():
-            try:
-                content = pyproject.read_text()
-                if '[build-system]' in content or '[tool.poetry]' in content:
-                    return True
-            except Exception:
-                pass
-
-        return False
-
-    def _has_tests(self, project_path: Path) -> bool:
-        """Check if project has tests directory"""
-        test_dirs = ['tests', 'test']
-        for test_dir in test_dirs:
-            if (project_path / test_dir).is_dir():
-                return True
-        return False
+        # Check pyproject.toml for build system (parse shared with the detector)
+        if 'pyproject.toml' not in entries:
+            return False
+        return _pyproject_builds_package(os.path.join(project_path, 'pyproject.toml'))
+
+    @staticmethod
+    def _has_tests(entries: Dict[str, bool]) -> bool:
+        """Check if project has tests directory, from _scan_entries() results"""
+        return entries.get('tests', False) or entries.get('test', False)
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _docker_context(python_version: str, framework: Optional[str]) -> Mapping[str, Any]:
+        """Docker image and port variables, built once per (Python version, framework)"""
+        return MappingProxyType({
+            'docker_base_image': f"python:{python_version}-slim",
+            'docker_port': PythonGenerator._get_framework_port(framework),
+        })
 
-    def _get_framework_port(self, framework: str) -> int:
+    @staticmethod
+    def _get_framework_port(framework: str) -> int:
         """Get default port for Python framework"""
         if not framework:
             return 8000
 
-        ports = {
-            'flask': 5000,
-            'django': 8000,
-            'fastapi': 8000,
-            'starlette': 8000,
-            'tornado': 8888,
-            'aiohttp': 8080,
-        }
-        return ports.get(framework.lower(), 8000)
-
-    def _is_valid_module(self, path: Path) -> bool:
-        """
-        Override parent method - Python modules have __init__.py
-        """
-        return (path / '__init__.py').exists()
+        return FRAMEWORK_PORTS.get(framework.lower(), 8000)
 
 
 # Example usage
@@ -17,7 +17,7 @@ setup(
         "typer[all]>=0.9.0",
         "jinja2>=3.1.2",
         "rich>=13.7.0",
-        "pydantic<2",
+        "tomli>=1.1.0; python_version < '3.11'",
     ],
     extras_require={
         "dev": [
@@ -30,7 +30,7 @@ setup(
     },
     entry_points={
         "console_scripts": [
-            "cicd=cli.main:main",
+            "cicd=cli.launcher:main",
         ],
     },
     package_data={
@@ -0,0 +1,51 @@
+"""
+Tests that the Jinja2 bytecode cache can never make rendering fail
+"""
+from jinja2 import FileSystemBytecodeCache
+
+from core import base_generator
+
+
+def _write_template(directory):
+    directory.mkdir()
+    (directory / 'hello.txt.j2').write_text('{% if name %}Hello {{ name }}{% endif %}\n')
+    return directory
+
+
+def test_unwritable_cache_dir_falls_back(tmp_path, monkeypatch):
+    cache_dir = tmp_path / 'cache'
+    monkeypatch.setattr(base_generator, 'CACHE_DIR', cache_dir)
+    monkeypatch.setattr(base_generator.os, 'access', lambda path, mode: False)
+
+    env, templates, _, _ = base_generator.BaseGenerator._load_environment(_write_template(tmp_path / 'templates'))
+
+    assert env.bytecode_cache.directory != str(cache_dir / 'jinja')
+    assert templates['hello.txt.j2'].render(name='world') == 'Hello world'
+
+
+def test_cache_write_errors_are_ignored(tmp_path, monkeypatch):
+    monkeypatch.setattr(base_generator, 'CACHE_DIR', tmp_path / 'cache')
+
+    def refuse(self, bucket):
+        raise PermissionError(13, 'Permission denied')
+
+    monkeypatch.setattr(FileSystemBytecodeCache, 'dump_bytecode', refuse)
+    monkeypatch.setattr(FileSystemBytecodeCache, 'load_bytecode', refuse)
+
+    _, templates, _, _ = base_generator.BaseGenerator._load_environment(_write_template(tmp_path / 'templates'))
+
+    assert templates['hello.txt.j2'].render(name='world') == 'Hello world'
+
+
+def test_truncated_cache_file_is_recompiled(tmp_path, monkeypatch):
+    monkeypatch.setattr(base_generator, 'CACHE_DIR', tmp_path / 'cache')
+    templates_dir = _write_template(tmp_path / 'templates')
+    base_generator.BaseGenerator._load_environment(templates_dir)
+
+    for cache_file in (tmp_path / 'cache' / 'jinja').iterdir():
+        data = cache_file.read_bytes()
+        cache_file.write_bytes(data[:len(data) // 2])
+
+    _, templates, _, _ = base_generator.BaseGenerator._load_environment(templates_dir)
+
+    assert templates['hello.txt.j2'].render(name='world') == 'Hello world'
@@ -0,0 +1,96 @@
+"""
+Tests for the on-disk detection cache: hits, misses, invalidation and TTL
+"""
+import os
+import time
+
+import pytest
+
+from core import detection_cache
+
+FRAMEWORKS = ['python', 'node', 'maven', 'gradle', 'dotnet', 'java']
+RESULT = {'language': 'dotnet', 'dotnet_version': '6.0'}
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep cache entries out of the real per-user cache dir"""
+    directory = tmp_path / 'cache'
+    monkeypatch.setattr(detection_cache, 'CACHE_DIR', directory)
+    return directory
+
+
+@pytest.fixture
+def project(tmp_path):
+    """A small project with a top-level manifest and a nested .csproj"""
+    root = tmp_path / 'project'
+    (root / 'src' / 'App').mkdir(parents=True)
+    (root / 'README.md').write_text('demo\n')
+    (root / 'src' / 'App' / 'App.csproj').write_text(
+        '<Project><PropertyGroup><TargetFramework>net6.0</TargetFramework></PropertyGroup></Project>'
+    )
+    return root
+
+
+def _edit(path, content):
+    """Rewrite a file and move its mtime forward so the change is always visible"""
+    stat = path.stat()
+    path.write_text(content)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_miss_when_nothing_saved(project):
+    assert detection_cache.load(project, FRAMEWORKS) is None
+
+
+def test_hit_after_save(project):
+    detection_cache.save(project, FRAMEWORKS, 'dotnet', RESULT)
+
+    assert detection_cache.load(project, FRAMEWORKS) == ('dotnet', RESULT)
+
+
+def test_miss_for_other_frameworks(project):
+    detection_cache.save(project, FRAMEWORKS, 'dotnet', RESULT)
+
+    assert detection_cache.load(project, ['dotnet']) is None
+
+
+def test_top_level_edit_invalidates(project):
+    detection_cache.save(project, FRAMEWORKS, 'dotnet', RESULT)
+    _edit(project / 'README.md', 'edited demo\n')
+
+    assert detection_cache.load(project, FRAMEWORKS) is None
+
+
+def test_nested_csproj_edit_invalidates(project):
+    detection_cache.save(project, FRAMEWORKS, 'dotnet', RESULT)
+    csproj = project / 'src' / 'App' / 'App.csproj'
+    _edit(csproj, csproj.read_text().replace('net6.0', 'net8.0'))
+
+    assert detection_cache.load(project, FRAMEWORKS) is None
+
+
+def test_added_nested_py_file_invalidates(project):
+    detection_cache.save(project, FRAMEWORKS, 'dotnet', RESULT)
+    (project / 'src' / 'tool.py').write_text('print("hi")\n')
+
+    assert detection_cache.load(project, FRAMEWORKS) is None
+
+
+def test_excluded_dirs_do_not_invalidate(project):
+    (project / 'node_modules' / 'pkg').mkdir(parents=True)
+    detection_cache.save(project, FRAMEWORKS, 'dotnet', RESULT)
+    (project / 'node_modules' / 'pkg' / 'index.py').write_text('')
+
+    assert detection_cache.load(project, FRAMEWORKS) == ('dotnet', RESULT)
+
+
+def test_entry_expires_after_ttl(project, monkeypatch):
+    detection_cache.save(project, FRAMEWORKS, 'dotnet', RESULT)
+    saved_at = time.time()
+
+    monkeypatch.setattr(detection_cache.time, 'time', lambda: saved_at + detection_cache.CACHE_TTL - 60)
+    assert detection_cache.load(project, FRAMEWORKS) == ('dotnet', RESULT)
+
+    monkeypatch.setattr(detection_cache.time, 'time', lambda: saved_at + detection_cache.CACHE_TTL + 1)
+    assert detection_cache.load(project, FRAMEWORKS) is None
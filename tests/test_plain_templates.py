@@ -0,0 +1,61 @@
+"""
+Tests that plain-template renderers produce exactly what Jinja2 renders
+"""
+from pathlib import Path
+
+import pytest
+from jinja2 import meta
+
+from core import base_generator
+
+FRAMEWORKS_DIR = Path(__file__).resolve().parent.parent / 'frameworks'
+TEMPLATE_DIRS = sorted(FRAMEWORKS_DIR.glob('*/templates'))
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep compiled templates out of the real per-user cache dir"""
+    monkeypatch.setattr(base_generator, 'CACHE_DIR', tmp_path / 'cache')
+
+
+def _contexts(env, source):
+    """A context giving every variable a value, and one missing every other variable"""
+    names = sorted(meta.find_undeclared_variables(env.parse(source)))
+    full = {name: f'<{name}:{index}>' for index, name in enumerate(names)}
+    full.update({'flag': True, 'count': 3, 'ratio': 0.5})
+    partial = {name: value for index, (name, value) in enumerate(full.items()) if index % 2}
+    return full, partial
+
+
+@pytest.mark.parametrize('templates_dir', TEMPLATE_DIRS, ids=lambda path: path.parent.name)
+def test_shipped_templates_render_identically(templates_dir):
+    env, templates, _, renderers = base_generator.BaseGenerator._load_environment(templates_dir)
+
+    assert templates
+    for name, renderer in renderers.items():
+        source = (templates_dir / name).read_text(encoding='utf-8')
+        for context in _contexts(env, source):
+            assert renderer(context) == templates[name].render(context), name
+
+
+@pytest.mark.parametrize('name', ['range', 'dict', 'lipsum', 'cycler', 'joiner', 'namespace'])
+def test_environment_globals_need_jinja(tmp_path, name):
+    templates_dir = tmp_path / 'templates'
+    templates_dir.mkdir()
+    (templates_dir / 'global.txt.j2').write_text(f'value: {{{{ {name} }}}}\n')
+
+    env, templates, _, renderers = base_generator.BaseGenerator._load_environment(templates_dir)
+
+    assert 'global.txt.j2' not in renderers
+    assert templates['global.txt.j2'].render({}) != 'value: '
+
+
+def test_plain_template_gets_a_renderer(tmp_path):
+    templates_dir = tmp_path / 'templates'
+    templates_dir.mkdir()
+    (templates_dir / 'plain.txt.j2').write_text('image: {{ image }}:{{tag}}\n')
+
+    _, templates, _, renderers = base_generator.BaseGenerator._load_environment(templates_dir)
+
+    context = {'image': 'app', 'tag': 1}
+    assert renderers['plain.txt.j2'](context) == templates['plain.txt.j2'].render(context) == 'image: app:1'